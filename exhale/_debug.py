@@ -0,0 +1,218 @@
+# -*- coding: utf8 -*-
+########################################################################################
+# This file is part of exhale.  Copyright (c) 2017-2022, Stephen McDowell.             #
+# Full BSD 3-Clause license available here:                                            #
+#                                                                                      #
+#                https://github.com/svenevs/exhale/blob/master/LICENSE                 #
+########################################################################################
+'''
+Console dumps of a parsed :class:`~exhale.graph.ExhaleRoot`, only imported by
+:func:`~exhale.graph.ExhaleRoot.toConsole` for verbose builds.
+'''
+
+from __future__ import unicode_literals
+
+from . import utils
+from .graph import _CLASS_HIERARCHY_KINDS, _IndentTable
+
+import sys
+import textwrap
+
+__all__       = ["rootToConsole", "consoleFormat", "nodeToConsole"]
+
+# nodeToConsole indents by two spaces per level.
+_CONSOLE_INDENT = _IndentTable("  ")
+
+
+def rootToConsole(root):
+    '''
+    Prints every node list of ``root`` (an :class:`~exhale.graph.ExhaleRoot`) to the
+    console, see :func:`~exhale.graph.ExhaleRoot.toConsole`.
+    '''
+    fmt_spec = {
+        "class":     utils.AnsiColors.BOLD_MAGENTA,
+        "struct":    utils.AnsiColors.BOLD_CYAN,
+        "define":    utils.AnsiColors.BOLD_YELLOW,
+        "enum":      utils.AnsiColors.BOLD_MAGENTA,
+        "enumvalue": utils.AnsiColors.BOLD_RED,     # red means unused in framework
+        "function":  utils.AnsiColors.BOLD_CYAN,
+        "file":      utils.AnsiColors.BOLD_YELLOW,
+        "dir":       utils.AnsiColors.BOLD_MAGENTA,
+        "group":     utils.AnsiColors.BOLD_RED,     # red means unused in framework
+        "namespace": utils.AnsiColors.BOLD_CYAN,
+        "typedef":   utils.AnsiColors.BOLD_YELLOW,
+        "union":     utils.AnsiColors.BOLD_MAGENTA,
+        "variable":  utils.AnsiColors.BOLD_CYAN,
+        "page":      utils.AnsiColors.BOLD_YELLOW
+    }
+
+    consoleFormat(
+        "{0} and {1}".format(
+            utils._use_color("Classes", fmt_spec["class"],  sys.stderr),
+            utils._use_color("Structs", fmt_spec["struct"], sys.stderr),
+        ),
+        root.class_like,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Defines", fmt_spec["define"], sys.stderr),
+        root.defines,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Enums", fmt_spec["enum"], sys.stderr),
+        root.enums,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Enum Values (unused)", fmt_spec["enumvalue"], sys.stderr),
+        root.enum_values,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Functions", fmt_spec["function"], sys.stderr),
+        root.functions,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Files", fmt_spec["file"], sys.stderr),
+        root.files,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Directories", fmt_spec["dir"], sys.stderr),
+        root.dirs,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Groups (unused)", fmt_spec["group"], sys.stderr),
+        root.groups,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Namespaces", fmt_spec["namespace"], sys.stderr),
+        root.namespaces,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Typedefs", fmt_spec["typedef"], sys.stderr),
+        root.typedefs,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Unions", fmt_spec["union"], sys.stderr),
+        root.unions,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Variables", fmt_spec["variable"], sys.stderr),
+        root.variables,
+        fmt_spec
+    )
+    consoleFormat(
+        utils._use_color("Pages", fmt_spec["page"], sys.stderr),
+        root.pages,
+        fmt_spec
+    )
+
+
+def consoleFormat(sectionTitle, lst, fmt_spec):
+    '''
+    Helper function for ``rootToConsole``.  Prints the given ``sectionTitle`` and calls
+    ``nodeToConsole`` with ``0`` as the level for every ExhaleNode in ``lst``.
+
+    **Parameters**
+        ``sectionTitle`` (str)
+            The title that will be printed with some visual separators around it.
+
+        ``lst`` (list)
+            The list of ExhaleNodes to print to the console.
+    '''
+    utils.verbose_log(textwrap.dedent('''
+        ###########################################################
+        ## {0}
+        ###########################################################'''.format(sectionTitle)))
+    for node in lst:
+        nodeToConsole(node, 0, fmt_spec)
+
+
+def nodeToConsole(node, level, fmt_spec, printChildren=True):
+    '''
+    Debugging tool for printing hierarchies / ownership to the console.  Recursively
+    prints the children of ``node`` if it is not a directory or a file, and
+    ``printChildren == True``.
+
+    .. todo:: fmt_spec docs needed. keys are ``kind`` and values are color spec
+
+    **Parameters**
+        ``node`` (:class:`~exhale.graph.ExhaleNode`)
+            The node to print.
+
+        ``level`` (int)
+            The indentation level to be used, should be greater than or equal to 0.
+
+        ``printChildren`` (bool)
+            Whether or not the children found in ``node.children`` should be printed
+            with ``level+1``.  Default is True, set to False for directories and files.
+    '''
+    indent = _CONSOLE_INDENT[level]
+    utils.verbose_log("{indent}- [{kind}]: {name}".format(
+        indent=indent,
+        kind=utils._use_color(node.kind, fmt_spec[node.kind], sys.stderr),
+        name=node.name
+    ))
+    # files are children of directories, the file section will print those children
+    if printChildren or node.kind == "dir":
+        _TO_CONSOLE_CHILDREN.get(node.kind, _console_children)(node, level, fmt_spec)
+
+
+# Printing the children of a node in nodeToConsole, dispatched on the node kind.
+def _console_children(node, level, fmt_spec):
+    for c in node.children:
+        nodeToConsole(c, level + 1, fmt_spec)
+
+
+def _console_dir(node, level, fmt_spec):
+    for c in node.children:
+        nodeToConsole(c, level + 1, fmt_spec, printChildren=False)
+
+
+def _console_file(node, level, fmt_spec):
+    next_indent = _CONSOLE_INDENT[level + 1]
+    utils.verbose_log("{next_indent}[[[ location=\"{loc}\" ]]]".format(
+        next_indent=next_indent,
+        loc=node.location
+    ))
+    for incl in node.includes:
+        utils.verbose_log("{next_indent}- #include <{incl}>".format(
+            next_indent=next_indent,
+            incl=incl
+        ))
+    for ref, name in node.included_by:
+        utils.verbose_log("{next_indent}- included by: [{name}]".format(
+            next_indent=next_indent,
+            name=name
+        ))
+    for n in node.namespaces_used:
+        nodeToConsole(n, level + 1, fmt_spec, printChildren=False)
+    for c in node.children:
+        nodeToConsole(c, level + 1, fmt_spec)
+
+
+def _console_class_like(node, level, fmt_spec):
+    relevant_children = [c for c in node.children if c.kind in _CLASS_HIERARCHY_KINDS]
+    for rc in sorted(relevant_children):
+        nodeToConsole(rc, level + 1, fmt_spec)
+
+
+def _console_no_children(node, level, fmt_spec):
+    pass
+
+
+_TO_CONSOLE_CHILDREN = {
+    "dir": _console_dir,
+    "file": _console_file,
+    "class": _console_class_like,
+    "struct": _console_class_like,
+    "union": _console_no_children
+}
@@ -45,19 +45,13 @@ from __future__ import unicode_literals
 import os
 import six
 import textwrap
+from io import StringIO
 from pathlib import Path
 
 from sphinx.errors import ConfigError, ExtensionError
 from sphinx.util import logging
 from types import FunctionType, ModuleType
 
-try:
-    # Python 2 StringIO
-    from cStringIO import StringIO
-except ImportError:
-    # Python 3 StringIO
-    from io import StringIO
-
 
 logger = logging.getLogger(__name__)
 """
@@ -963,6 +957,14 @@ simply be ``./_doxygen/xml``.
    is an absolute path.
 '''
 
+_doxygen_xml_files = None
+'''
+The names of the files in :data:`~exhale.configs._doxygen_xml_output_directory`.  This
+is populated once by :func:`ExhaleRoot.discoverAllNodes
+<exhale.graph.ExhaleRoot.discoverAllNodes>` so that checking whether ``{refid}.xml``
+exists does not need a ``stat`` for every node.  ``None`` until then.
+'''
+
 exhaleExecutesDoxygen = False
 '''
 **Optional**
@@ -1730,7 +1732,9 @@ def apply_sphinx_configurations(app):
 
     # Specify where the doxygen output should be going
     global _doxygen_xml_output_directory
+    global _doxygen_xml_files
     _doxygen_xml_output_directory = doxy_xml_dir
+    _doxygen_xml_files = None  # doxygen may not have been run yet
 
     # If requested, the time is nigh for executing doxygen.  The strategy:
     # 1. Execute doxygen if requested
@@ -16,22 +16,281 @@ import re
 import os
 import sys
 import codecs
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import hashlib
+import html
+from io import StringIO
 import itertools
+import operator
 from pathlib import Path
 import platform
 import textwrap
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 
-try:
-    # Python 2 StringIO
-    from cStringIO import StringIO
-except ImportError:
-    # Python 3 StringIO
-    from io import StringIO
+__all__       = ["ExhaleRoot", "ExhaleNode", "FileNode"]
 
-__all__       = ["ExhaleRoot", "ExhaleNode"]
+# Kind groupings checked on every node during the hierarchy traversals.  The kinds are
+# interned strings, so a frozenset lookup is cheaper than a chain of ``==`` comparisons.
+_CLASS_OR_STRUCT = frozenset(("class", "struct"))
+_CLASS_HIERARCHY_KINDS = frozenset(("class", "struct", "enum", "union"))
+# Keys of ExhaleNode.nested_by_kinds used by the single kind findNested* methods.
+_NAMESPACE_KIND = frozenset(("namespace",))
+_DIR_KIND = frozenset(("dir",))
+_ENUM_KIND = frozenset(("enum",))
+_UNION_KIND = frozenset(("union",))
+
+# Kinds ExhaleRoot.fileRefDiscovery adds to a file when the file's Doxygen xml refers to
+# them, and the kinds it looks for in the program listing of a file.
+_FILE_OWNED_KINDS = frozenset(("struct", "class", "function", "typedef", "define", "enum", "union"))
+_ORPHAN_KINDS = frozenset(("enum", "variable", "function", "typedef", "union"))
+# Kinds whose file and link names are derived from their name (or location), rather
+# than their refid, see ExhaleRoot.initializeNodeFilenameAndLink.
+_SPECIAL_CASE_KINDS = frozenset(("dir", "file", "namespace", "page"))
+
+# Makes the name / location of a special case kind usable in a file and link name.
+_UNIQUE_ID_TABLE = str.maketrans({":": "_", os.sep: "_", " ": "_"})
+
+# platform.system() does not change while exhale runs, only ask once.
+_IS_WINDOWS = platform.system() == "Windows"
+
+# Sort key for nodes once ExhaleRoot.sortInternals has cached every ExhaleNode.sort_key,
+# orders exactly like ExhaleNode.__lt__ without a Python level comparison per pair.
+_BY_SORT_KEY = operator.attrgetter("sort_key")
+
+# Section heading written by ExhaleRoot.generateSortedChildListString.
+_SORTED_CHILD_SECTION_TMPL = "\n\n{heading}\n{heading_mark}\n\n"
+
+# Pre-dedented templates for the generated documents, ``textwrap.dedent`` is not run on
+# every write.  Used by ExhaleRoot.generateSingleNodeRST and friends.
+_SECTION_HEADING_TMPL = textwrap.dedent('''
+    {heading}
+    {heading_mark}
+
+''')
+_INHERITANCE_HEADING_TMPL = "\n{heading}\n{heading_mark}\n"
+_LEAF_HEADER_TMPL = textwrap.dedent('''\
+    {link}
+
+    {heading}
+    {heading_mark}
+
+    {defined_in}
+
+''')
+_PAGE_HEADER_TMPL = textwrap.dedent('''\
+    {link}
+
+    {heading}
+    {heading_mark}
+
+''')
+_NAMESPACE_HEADER_TMPL = textwrap.dedent('''
+    .. _{link}:
+
+    {heading}
+    {heading_mark}
+
+''')
+_FILE_HEADER_TMPL = "\n{link}\n\n{heading}\n{heading_mark}\n"
+_PROGRAM_LISTING_HEADER_TMPL = textwrap.dedent('''
+    {link}
+
+    {heading}
+    {heading_mark}
+
+    |exhale_lsh| :ref:`Return to documentation for file <{file}>` (``{location}``)
+
+    .. |exhale_lsh| unicode:: U+021B0 .. UPWARDS ARROW WITH TIP LEFTWARDS
+
+''')  # NOTE: newline required at end (#171)
+_PROGRAM_LISTING_TOCTREE_TMPL = textwrap.dedent('''
+    .. toctree::
+       :maxdepth: 1
+
+       {prog_link}
+''')
+_PARENT_DIRECTORY_TMPL = textwrap.dedent('''
+    |exhale_lsh| :ref:`Parent directory <{parent_link}>` (``{parent_name}``)
+
+    .. |exhale_lsh| unicode:: U+021B0 .. UPWARDS ARROW WITH TIP LEFTWARDS
+
+''')  # NOTE: newline required at end (#171)
+_INCLUDE_LINK_ITEM_TMPL = "\n- ``{include}`` (:ref:`{link}`)\n"
+_INCLUDE_ITEM_TMPL = "\n- ``{include}``\n"
+_LINK_ITEM_TMPL = "\n- :ref:`{link}`\n"
+# The toctree ExhaleRoot.enumerateAll writes for each node, followed by its file name.
+_UNABRIDGED_TOCTREE_TMPL = "\n.. toctree::\n   :maxdepth: {depth}\n\n   "
+
+# Turns a ``link_name`` into the html anchor Breathe / Sphinx generate for it.  Matching
+# ``__`` before ``_`` collapses each pair of underscores into a single hyphen, the same as
+# ``link_name.replace("__", "_").replace("_", "-")`` but in one pass (``___`` -> ``--``).
+_LINK_ANCHOR_RE = re.compile(r"__?")
+
+# The tags of a file's Doxygen xml used by _parseFileXml.  Every <sectiondef> is included
+# only so that it can be released as soon as it is parsed.
+_FILE_XML_TAGS = (
+    "compounddef", "location", "includes", "includedby", "codeline", "programlisting",
+    "sectiondef", "memberdef", "innerclass", "innerconcept", "innerdir", "innerfile",
+    "innergroup", "innermodule", "innernamespace", "innerpage"
+)
+
+# The only tags of a page's Doxygen xml used by ExhaleRoot.discoverAllNodes.
+_PAGE_STRAINER = SoupStrainer(["title", "innerpage", "location"])
+
+
+class _FileXml(object):
+    '''
+    What :func:`~exhale.graph.ExhaleRoot.discoverAllNodes` and
+    :func:`~exhale.graph.ExhaleRoot.fileRefDiscovery` need from the Doxygen xml of a
+    file, see ``_parseFileXml``.
+
+    ``language``
+        The ``language`` of the ``<compounddef>`` (or ``None``).
+
+    ``location``
+        The normalized ``file`` of the ``<location>`` of the file (or ``None``).
+
+    ``includes``
+        The list of ``<includes>`` strings.
+
+    ``included_by``
+        The list of ``<includedby>`` ``(refid, name)`` tuples.
+
+    ``inner_classes``
+        The list of ``<innerclass>`` ``(refid, name)`` tuples (``refid`` may be ``None``).
+
+    ``inner_refids``
+        The list of ``refid`` of the ``<innerclass>``, ``<innernamespace>``, etc tags.
+
+    ``memberdef_ids``
+        The list of ``id`` of every ``<memberdef>`` of the ``<compounddef>``.
+
+    ``member_refids``
+        The ``refid`` of every ``<ref kindref="member">`` of the ``<programlisting>``.
+
+    ``program_listing``
+        The plain source lines of the ``<programlisting>``.
+    '''
+    __slots__ = (
+        "language", "location", "includes", "included_by", "inner_classes", "inner_refids",
+        "memberdef_ids", "member_refids", "program_listing"
+    )
+
+    def __init__(self):
+        self.language        = None
+        self.location        = None
+        self.includes        = []
+        self.included_by     = []
+        self.inner_classes   = []
+        self.inner_refids    = []
+        self.memberdef_ids   = []
+        self.member_refids   = []
+        self.program_listing = []
+
+
+def _parseFileXml(doxy_xml_path):
+    '''
+    Parses the Doxygen xml of a file node, once, for both
+    :func:`~exhale.graph.ExhaleRoot.discoverAllNodes` and
+    :func:`~exhale.graph.ExhaleRoot.fileRefDiscovery`.  The xml is streamed with
+    :func:`lxml.etree.iterparse`, every element is released as soon as it has been
+    read.  Only plain data is returned and no node is touched, so that many files can
+    be parsed at the same time.
+
+    :Parameters:
+        ``doxy_xml_path`` (str)
+            The path to the ``{refid}.xml`` of the file.
+
+    :Return (_FileXml):
+        The parts of the xml that are used, see ``_FileXml``.
+
+    :Raises:
+        ``RuntimeError``
+            If no ``<compounddef>`` could be parsed (e.g., the xml is garbage).
+    '''
+    file_xml = _FileXml()
+    for _, elem in etree.iterparse(doxy_xml_path, events=("end",), tag=_FILE_XML_TAGS, recover=True):
+        tag = elem.tag
+        if tag == "compounddef":
+            file_xml.language = elem.get("language")
+            return file_xml
+        elif tag == "codeline":
+            # only the listing of the file itself, not a code block of a description
+            listing = elem.getparent()
+            if listing is not None and listing.getparent() is not None and \
+                    listing.getparent().tag == "compounddef":
+                for ref in elem.iter("ref"):
+                    refid = ref.get("refid")
+                    if refid is not None and ref.get("kindref") == "member":
+                        file_xml.member_refids.append(refid)
+            # the plain source of this line, <sp/> is how doxygen spells " "
+            for sp in elem.iter("sp"):
+                sp.text = " "
+            file_xml.program_listing.append("".join(elem.itertext()) + "\n")
+        elif tag == "includedby":
+            # gather included by references
+            ref = elem.get("refid")
+            if ref is not None:
+                file_xml.included_by.append((ref, elem.text or ""))
+        elif tag == "includes":
+            # gather includes lines
+            if elem.text:
+                file_xml.includes.append(elem.text)
+        elif elem.getparent().tag != "compounddef":
+            # only the <location> and <memberdef> of the file itself are of interest
+            pass
+        elif tag == "location":
+            location_file = elem.get("file")
+            if location_file is not None and file_xml.location is None:
+                file_xml.location = os.path.normpath(location_file)
+        elif tag == "memberdef":
+            member_id = elem.get("id")
+            if member_id is not None:
+                file_xml.memberdef_ids.append(member_id)
+        elif tag.startswith("inner"):
+            refid = elem.get("refid")
+            if refid is not None:
+                file_xml.inner_refids.append(refid)
+            if tag == "innerclass":
+                file_xml.inner_classes.append((refid, elem.text))
+        # nothing else is needed from a <sectiondef> or <programlisting>
+        elem.clear()
+
+    raise RuntimeError("No <compounddef> found in [{0}].".format(doxy_xml_path))
+
+
+def _absStripPath():
+    '''
+    The normalized absolute path of :data:`~exhale.configs.doxygenStripFromPath`, which
+    is stripped from the front of any Doxygen location that still contains it.
+
+    :Return (str):
+        ``os.path.normpath(os.path.abspath(configs.doxygenStripFromPath))``, or ``None``
+        if :data:`~exhale.configs.doxygenStripFromPath` is not set.
+    '''
+    if configs.doxygenStripFromPath is None:
+        return None
+    return os.path.normpath(os.path.abspath(configs.doxygenStripFromPath))
+
+
+class _IndentTable(dict):
+    """Maps a nesting ``level`` to ``unit * level``, each level is only built once."""
+
+    def __init__(self, unit):
+        super(_IndentTable, self).__init__()
+        self.unit = unit
+
+    def __missing__(self, level):
+        indent = self[level] = self.unit * level
+        return indent
+
+
+# ExhaleNode.toHierarchy indents by four spaces per level (both for the bulleted lists
+# and the Tree View html / json).
+_HIERARCHY_INDENT = _IndentTable("    ")
 
 
 ########################################################################################
@@ -71,7 +330,8 @@ class ExhaleNode(object):
 
         ``children`` (list)
             A potentially empty list of ``ExhaleNode`` object references that are
-            considered a child of this Node.  Please note that a child reference in any
+            considered a child of this Node.  Once :func:`~exhale.graph.ExhaleRoot.parse`
+            is complete this is a ``tuple``.  Please note that a child reference in any
             ``children`` list may be stored in **many** other lists.  Mutating a given
             child will mutate the object, and therefore affect other parents of this
             child.  Lastly, a node of kind ``enum`` will never have its ``enumvalue``
@@ -109,6 +369,14 @@ class ExhaleNode(object):
             ``file_name``. When the reStructuredText document for this node is being
             written, the root object will set this field.
 
+        ``cdef`` (:class:`bs4.element.Tag`)
+            The ``<compounddef>`` of the Doxygen xml for this node.  Only kept for
+            namespaces by
+            :func:`~exhale.graph.ExhaleRoot.discoverAllNodes` so that later passes do
+            not need to parse the same xml again, ``None`` otherwise.  Released
+            (reset to ``None``) once :func:`~exhale.graph.ExhaleRoot.parse` no longer
+            needs it.
+
         The following two fields are used for tracking what has or has not already been
         included in the hierarchy views.  Things like classes or structs in the global
         namespace will not be found by :func:`~exhale.graph.ExhaleNode.inClassHierarchy`,
@@ -120,8 +388,8 @@ class ExhaleNode(object):
         ``in_file_hierarchy`` (bool)
             Whether or not this node has already been incorporated in the file view.
 
-        This class wields duck typing.  If ``self.kind == "file"``, then the additional
-        member variables below exist:
+        This class wields duck typing.  If ``self.kind == "file"``, then the node is a
+        :class:`~exhale.graph.FileNode` and the additional member variables below exist:
 
         ``namespaces_used`` (list)
             A list of namespace nodes that are either defined or used in this file.
@@ -141,8 +409,14 @@ class ExhaleNode(object):
             is physically in relation to the *Doxygen* root.
 
         ``program_listing`` (list)
-            A list of strings that is the Doxygen xml <programlisting>, without the
-            opening or closing <programlisting> tags.
+            A list of strings that are the lines of the Doxygen xml <programlisting>
+            as plain source code (xml tags removed, entities resolved), each ending
+            with a newline.
+
+        ``file_xml``
+            What was parsed from the Doxygen xml for this file by
+            :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`, released (reset to
+            ``None``) by :func:`~exhale.graph.ExhaleRoot.fileRefDiscovery`.
 
         ``program_file`` (list)
             Managed externally by the root similar to ``file_name`` etc, this is the
@@ -156,6 +430,34 @@ class ExhaleNode(object):
             ``program_file``. Set to ``None`` on creation, refer to
             :func:`~exhale.graph.ExhaleRoot.initializeNodeFilenameAndLink`.
     '''
+    # Large projects create tens of thousands of nodes, avoid a ``__dict__`` per node.
+    # Kind-specific members are only assigned for that kind, so ``hasattr`` checks on
+    # e.g. ``program_file`` continue to work for every other kind.  The members only
+    # files have are declared by FileNode.
+    __slots__ = (
+        "name", "kind", "refid", "root_owner", "template_params", "base_compounds",
+        "derived_compounds", "def_in_file", "children", "parent", "file_name",
+        "link_name", "title", "in_page_hierarchy", "in_class_hierarchy",
+        "in_file_hierarchy", "in_class_hierarchy_cache", "in_file_hierarchy_cache",
+        "tree_view_link", "sort_key", "hierarchy_descendants", "name_scopes",
+        "nested_by_kinds",
+        # kind == "file" or kind == "page"
+        "location",
+        # parsed Doxygen xml and its <compounddef>, see ExhaleRoot.compoundSoup
+        "soup", "cdef",
+        # kind == "function"
+        "return_type", "parameters", "template"
+    )
+
+    def __new__(cls, *args, **kwargs):
+        # ExhaleNode(name, "file", refid) creates a FileNode, subclasses are left alone
+        # (and may take different constructor arguments)
+        if cls is ExhaleNode:
+            kind = args[1] if len(args) > 1 else kwargs.get("kind")
+            if kind == "file":
+                cls = FileNode
+        return super(ExhaleNode, cls).__new__(cls)
+
     def __init__(self, name, kind, refid):
         self.name        = os.path.normpath(name) if kind == 'dir' else name
         self.kind        = kind
@@ -183,6 +485,16 @@ class ExhaleNode(object):
         self.in_page_hierarchy = False
         self.in_class_hierarchy = False
         self.in_file_hierarchy = False
+        # memoized inClassHierarchy / inFileHierarchy of namespaces / directories
+        self.in_class_hierarchy_cache = None
+        self.in_file_hierarchy_cache = None
+        self.tree_view_link = None  # see treeViewLink
+        self.sort_key = None  # see __lt__
+        self.hierarchy_descendants = {}  # see hierarchySortedDirectDescendants
+        self.name_scopes = None  # see name_parts
+        self.nested_by_kinds = {}  # see nestedOfKinds
+        self.soup = None  # the parsed Doxygen xml, see ExhaleRoot.compoundSoup
+        self.cdef = None  # the parsed <compounddef>, see ExhaleRoot.discoverAllNodes
         # kind-specific additional information
         if self.kind == "file":
             self.namespaces_used   = []  # ExhaleNodes
@@ -193,6 +505,7 @@ class ExhaleNode(object):
             self.program_listing   = []  # strings
             self.program_file      = ""
             self.program_link_name = ""
+            self.file_xml          = None  # see ExhaleRoot.discoverAllNodes
 
         if self.kind == "function":
             self.return_type = None # string (void, int, etc)
@@ -203,6 +516,9 @@ class ExhaleNode(object):
         '''
         The ``ExhaleRoot`` class stores a bunch of lists of ``ExhaleNode`` objects.
         When these lists are sorted, this method will be called to perform the sorting.
+        The comparison is performed on :func:`~exhale.graph.ExhaleNode.computeSortKey`,
+        which is cached in ``self.sort_key`` by
+        :func:`~exhale.graph.ExhaleRoot.sortInternals` once all names are final.
 
         :Parameters:
             ``other`` (ExhaleNode)
@@ -211,40 +527,67 @@ class ExhaleNode(object):
         :Return (bool):
             True if ``self`` is less than ``other``, False otherwise.
         '''
-        # allows alphabetical sorting within types
-        if self.kind == other.kind:
-            if self.kind != "page":
-                return self.name.lower() < other.name.lower()
-            else:
-                # Arbitrarily stuff "indexpage" refid to the front.  As doxygen presents
-                # things, it shows up last, but it does not matter since the sort we
-                # really care about will be with lists that do *NOT* have indexpage in
-                # them (for creating the page view hierarchy).
-                if self.refid == "indexpage":
-                    return True
-                elif other.refid == "indexpage":
-                    return False
+        return (self.sort_key or self.computeSortKey()) < (other.sort_key or other.computeSortKey())
 
-                # NOTE: kind of wasteful, but ordered_refs has ALL pages
-                # but realistically, there wont be *that* many pages. right? ;)
-                ordered_refs = [
-                    p.refid for p in self.root_owner.index_xml_page_ordering
-                ]
-                return ordered_refs.index(self.refid) < ordered_refs.index(other.refid)
+    @property
+    def name_parts(self):
+        '''
+        The ``::`` separated components of ``self.name``, e.g. ``("external", "Foo")``
+        for ``external::Foo``.  Cached in ``self.name_scopes`` together with the name it
+        was computed from, so renaming a node (see
+        :func:`~exhale.graph.ExhaleRoot.renameToNamespaceScopes`) is picked up.
+
+        :Return (tuple):
+            The ``str`` components of ``self.name``.
+        '''
+        return self._nameScopes()[1]
+
+    @property
+    def parent_qualname(self):
+        '''
+        The fully qualified name of the scope ``self.name`` is declared in, e.g.
+        ``external`` for ``external::Foo``.  The empty string if ``self.name`` has no
+        ``::``.  Cached alongside :attr:`~exhale.graph.ExhaleNode.name_parts`.
+
+        :Return (str):
+            ``"::".join(self.name_parts[:-1])``.
+        '''
+        return self._nameScopes()[2]
+
+    def _nameScopes(self):
+        scopes = self.name_scopes
+        if scopes is None or scopes[0] is not self.name:
+            parts = tuple(self.name.split("::"))
+            scopes = self.name_scopes = (self.name, parts, "::".join(parts[:-1]))
+        return scopes
+
+    def computeSortKey(self):
+        '''
+        Structs sort before classes, which sort before every other kind.  Every other
+        kind is sorted by the kind itself.  Within a kind, nodes are sorted
+        alphabetically (case insensitive), except for pages which are sorted in the
+        order they are presented in Doxygen's ``index.xml``.
+
+        :Return (tuple):
+            The key :func:`~exhale.graph.ExhaleNode.__lt__` compares.
+        '''
         # treat structs and classes as the same type
-        elif self.kind == "struct" or self.kind == "class":
-            if other.kind != "struct" and other.kind != "class":
-                return True
-            else:
-                if self.kind == "struct" and other.kind == "class":
-                    return True
-                elif self.kind == "class" and other.kind == "struct":
-                    return False
-                else:
-                    return self.name.lower() < other.name.lower()
-        # otherwise, sort based off the kind
-        else:
-            return self.kind < other.kind
+        if self.kind in _CLASS_OR_STRUCT:
+            return (0 if self.kind == "struct" else 1, self.kind, self.name.lower())
+        # allows alphabetical sorting within types
+        if self.kind != "page":
+            return (2, self.kind, self.name.lower())
+        # Arbitrarily stuff "indexpage" refid to the front.  As doxygen presents
+        # things, it shows up last, but it does not matter since the sort we
+        # really care about will be with lists that do *NOT* have indexpage in
+        # them (for creating the page view hierarchy).
+        if self.refid == "indexpage":
+            return (2, self.kind, -1)
+        # NOTE: ordered_refs has ALL pages, but this is only computed once per page
+        ordered_refs = [
+            p.refid for p in self.root_owner.index_xml_page_ordering
+        ]
+        return (2, self.kind, ordered_refs.index(self.refid))
 
     def __repr__(self):
         # NOTE: there will never be a way to eval(repr()) anything from this!  These are
@@ -357,7 +700,9 @@ class ExhaleNode(object):
                             if len(key) > len(parent_refid) and key in refid:
                                 parent_refid = key
                         parent = nodeByRefid[parent_refid]
-                        parent_page = os.path.basename(parent.file_name.replace(".rst", ".html"))
+                        parent_page = "{0}.html".format(
+                            os.path.splitext(os.path.basename(parent.file_name))[0]
+                        )
                         link = "{page}#{refid}".format(page=parent_page, refid=refid)
                     param_stream.write(
                         "#. `{typeid} <{link}>`_".format(
@@ -456,59 +801,94 @@ class ExhaleNode(object):
         bod_stream.close()
         return bod_value
 
+    def walk(self):
+        '''
+        Generator visiting this node and all of its descendants in depth-first pre-order,
+        i.e., the same order a recursive traversal of ``self.children`` would produce.
+        An explicit stack is used rather than recursion.
+        '''
+        stack = [self]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            yield node
+            extend(reversed(node.children))
+
+    def nestedOfKinds(self, kinds):
+        '''
+        This node and each of its descendants whose ``kind`` is in ``kinds``, in the
+        order :func:`~exhale.graph.ExhaleNode.walk` visits them.  The ``findNested*``
+        methods are only used once the graph is complete, so the result is computed
+        once per set of kinds and cached in ``self.nested_by_kinds``.
+
+        :Parameters:
+            ``kinds`` (frozenset)
+                The ``kind`` strings of the nodes to collect.
+
+        :Return (tuple):
+            The matching nodes.
+        '''
+        nested = self.nested_by_kinds.get(kinds)
+        if nested is None:
+            nested = tuple(n for n in self.walk() if n.kind in kinds)
+            self.nested_by_kinds[kinds] = nested
+        return nested
+
+    def findNestedByKind(self, buckets):
+        '''
+        Single pass alternative to calling several of the ``findNested*`` methods on the
+        same node.  Every node visited by :func:`~exhale.graph.ExhaleNode.walk` whose
+        kind is a key of ``buckets`` is appended to the corresponding list.
+
+        :Parameters:
+            ``buckets`` (dict)
+                Mapping of ``kind`` strings to the list nodes of that kind are to be
+                appended to.  Several kinds may share the same list.
+        '''
+        for node in self.nestedOfKinds(frozenset(buckets)):
+            buckets[node.kind].append(node)
+
     def findNestedNamespaces(self, lst):
         '''
-        Recursive helper function for finding nested namespaces.  If this node is a
-        namespace node, it is appended to ``lst``.  Each node also calls each of its
-        child ``findNestedNamespaces`` with the same list.
+        Helper function for finding nested namespaces.  This node and each of its
+        descendants that is a namespace node is appended to ``lst``.
 
         :Parameters:
             ``lst`` (list)
                 The list each namespace node is to be appended to.
         '''
-        if self.kind == "namespace":
-            lst.append(self)
-        for c in self.children:
-            c.findNestedNamespaces(lst)
+        lst.extend(self.nestedOfKinds(_NAMESPACE_KIND))
 
     def findNestedDirectories(self, lst):
         '''
-        Recursive helper function for finding nested directories.  If this node is a
-        directory node, it is appended to ``lst``.  Each node also calls each of its
-        child ``findNestedDirectories`` with the same list.
+        Helper function for finding nested directories.  This node and each of its
+        descendants that is a directory node is appended to ``lst``.
 
         :Parameters:
             ``lst`` (list)
                 The list each directory node is to be appended to.
         '''
-        if self.kind == "dir":
-            lst.append(self)
-        for c in self.children:
-            c.findNestedDirectories(lst)
+        lst.extend(self.nestedOfKinds(_DIR_KIND))
 
     def findNestedClassLike(self, lst):
         '''
-        Recursive helper function for finding nested classes and structs.  If this node
-        is a class or struct, it is appended to ``lst``.  Each node also calls each of
-        its child ``findNestedClassLike`` with the same list.
+        Helper function for finding nested classes and structs.  This node and each of
+        its descendants that is a class or struct is appended to ``lst``.
 
         :Parameters:
             ``lst`` (list)
                 The list each class or struct node is to be appended to.
         '''
-        if self.kind == "class" or self.kind == "struct":
-            lst.append(self)
-        for c in self.children:
-            c.findNestedClassLike(lst)
+        lst.extend(self.nestedOfKinds(_CLASS_OR_STRUCT))
 
     def findNestedEnums(self, lst):
         '''
-        Recursive helper function for finding nested enums.  If this node is a class or
-        struct it may have had an enum added to its child list.  When this occurred, the
-        enum was removed from ``self.enums`` in the :class:`~exhale.graph.ExhaleRoot`
-        class and needs to be rediscovered by calling this method on all of its
-        children.  If this node is an enum, it is because a parent class or struct
-        called this method, in which case it is added to ``lst``.
+        Helper function for finding nested enums.  If this node is a class or struct it
+        may have had an enum added to its child list.  When this occurred, the enum was
+        removed from ``self.enums`` in the :class:`~exhale.graph.ExhaleRoot` class and
+        needs to be rediscovered by calling this method.  This node and each of its
+        descendants that is an enum is appended to ``lst``.
 
         **Note**: this is used slightly differently than nested directories, namespaces,
         and classes will be.  Refer to
@@ -518,19 +898,15 @@ class ExhaleNode(object):
             ``lst`` (list)
                 The list each enum is to be appended to.
         '''
-        if self.kind == "enum":
-            lst.append(self)
-        for c in self.children:
-            c.findNestedEnums(lst)
+        lst.extend(self.nestedOfKinds(_ENUM_KIND))
 
     def findNestedUnions(self, lst):
         '''
-        Recursive helper function for finding nested unions.  If this node is a class or
-        struct it may have had a union added to its child list.  When this occurred, the
-        union was removed from ``self.unions`` in the :class:`~exhale.graph.ExhaleRoot`
-        class and needs to be rediscovered by calling this method on all of its
-        children.  If this node is a union, it is because a parent class or struct
-        called this method, in which case it is added to ``lst``.
+        Helper function for finding nested unions.  If this node is a class or struct it
+        may have had a union added to its child list.  When this occurred, the union was
+        removed from ``self.unions`` in the :class:`~exhale.graph.ExhaleRoot` class and
+        needs to be rediscovered by calling this method.  This node and each of its
+        descendants that is a union is appended to ``lst``.
 
         **Note**: this is used slightly differently than nested directories, namespaces,
         and classes will be.  Refer to
@@ -540,71 +916,7 @@ class ExhaleNode(object):
             ``lst`` (list)
                 The list each union is to be appended to.
         '''
-        if self.kind == "union":
-            lst.append(self)
-        for c in self.children:
-            c.findNestedUnions(lst)
-
-    def toConsole(self, level, fmt_spec, printChildren=True):
-        '''
-        Debugging tool for printing hierarchies / ownership to the console.  Recursively
-        calls children ``toConsole`` if this node is not a directory or a file, and
-        ``printChildren == True``.
-
-        .. todo:: fmt_spec docs needed. keys are ``kind`` and values are color spec
-
-        :Parameters:
-            ``level`` (int)
-                The indentation level to be used, should be greater than or equal to 0.
-
-            ``printChildren`` (bool)
-                Whether or not the ``toConsole`` method for the children found in
-                ``self.children`` should be called with ``level+1``.  Default is True,
-                set to False for directories and files.
-        '''
-        indent = "  " * level
-        utils.verbose_log("{indent}- [{kind}]: {name}".format(
-            indent=indent,
-            kind=utils._use_color(self.kind, fmt_spec[self.kind], sys.stderr),
-            name=self.name
-        ))
-        # files are children of directories, the file section will print those children
-        if self.kind == "dir":
-            for c in self.children:
-                c.toConsole(level + 1, fmt_spec, printChildren=False)
-        elif printChildren:
-            if self.kind == "file":
-                next_indent = "  " * (level + 1)
-                utils.verbose_log("{next_indent}[[[ location=\"{loc}\" ]]]".format(
-                    next_indent=next_indent,
-                    loc=self.location
-                ))
-                for incl in self.includes:
-                    utils.verbose_log("{next_indent}- #include <{incl}>".format(
-                        next_indent=next_indent,
-                        incl=incl
-                    ))
-                for ref, name in self.included_by:
-                    utils.verbose_log("{next_indent}- included by: [{name}]".format(
-                        next_indent=next_indent,
-                        name=name
-                    ))
-                for n in self.namespaces_used:
-                    n.toConsole(level + 1, fmt_spec, printChildren=False)
-                for c in self.children:
-                    c.toConsole(level + 1, fmt_spec)
-            elif self.kind == "class" or self.kind == "struct":
-                relevant_children = []
-                for c in self.children:
-                    if c.kind == "class" or c.kind == "struct" or \
-                       c.kind == "enum"  or c.kind == "union":
-                        relevant_children.append(c)
-
-                for rc in sorted(relevant_children):
-                    rc.toConsole(level + 1, fmt_spec)
-            elif self.kind != "union":
-                for c in self.children:
-                    c.toConsole(level + 1, fmt_spec)
+        lst.extend(self.nestedOfKinds(_UNION_KIND))
 
     def typeSort(self):
         '''
@@ -639,13 +951,13 @@ class ExhaleNode(object):
             True if this node should be included in the class view --- either it is a
             node of kind ``struct``, ``class``, ``enum``, ``union``, or it is a
             ``namespace`` that one or more if its descendants was one of the previous
-            four kinds.  Returns False otherwise.
+            four kinds.  Returns False otherwise.  For namespaces, the answer is computed
+            once and stored in ``self.in_class_hierarchy_cache``.
         '''
         if self.kind == "namespace":
-            for c in self.children:
-                if c.inClassHierarchy():
-                    return True
-            return False
+            if self.in_class_hierarchy_cache is None:
+                self.in_class_hierarchy_cache = any(c.inClassHierarchy() for c in self.children)
+            return self.in_class_hierarchy_cache
         else:
             # flag that this node is already in the class view so we can find the
             # missing top level nodes at the end
@@ -656,7 +968,7 @@ class ExhaleNode(object):
                 if exclude.match(self.name):
                     return False
 
-            return self.kind in {"struct", "class", "enum", "union"}
+            return self.kind in _CLASS_HIERARCHY_KINDS
 
     def inFileHierarchy(self):
         '''
@@ -667,7 +979,8 @@ class ExhaleNode(object):
         :Return (bool):
             True if this node should be included in the file view --- either it is a
             node of kind ``file``, or it is a ``dir`` that one or more if its
-            descendants was a ``file``.  Returns False otherwise.
+            descendants was a ``file``.  Returns False otherwise.  For directories, the
+            answer is computed once and stored in ``self.in_file_hierarchy_cache``.
         '''
         if self.kind == "file":
             # flag that this file is already in the directory view so that potential
@@ -675,9 +988,9 @@ class ExhaleNode(object):
             self.in_file_hierarchy = True
             return True
         elif self.kind == "dir":
-            for c in self.children:
-                if c.inFileHierarchy():
-                    return True
+            if self.in_file_hierarchy_cache is None:
+                self.in_file_hierarchy_cache = any(c.inFileHierarchy() for c in self.children)
+            return self.in_file_hierarchy_cache
         return False
 
     def inHierarchy(self, hierarchyType):
@@ -691,6 +1004,19 @@ class ExhaleNode(object):
             raise RuntimeError("'{}' is not a valid hierarchy type".format(hierarchyType))
 
     def hierarchySortedDirectDescendants(self, hierarchyType):
+        '''
+        The children of this node to be included in the specified hierarchy, in the
+        order they are to be presented.  The hierarchies are only generated once the
+        graph is complete, so the result is computed once per ``hierarchyType`` and
+        cached in ``self.hierarchy_descendants``.
+        '''
+        descendants = self.hierarchy_descendants.get(hierarchyType)
+        if descendants is None:
+            descendants = self._hierarchySortedDirectDescendants(hierarchyType)
+            self.hierarchy_descendants[hierarchyType] = descendants
+        return descendants
+
+    def _hierarchySortedDirectDescendants(self, hierarchyType):
         if hierarchyType == "page":
             if self.kind != "page":
                 raise RuntimeError(
@@ -699,19 +1025,22 @@ class ExhaleNode(object):
             return sorted(self.children)
         elif hierarchyType == "class":
             # search for nested children to display as sub-items in the tree view
-            if self.kind == "class" or self.kind == "struct":
-                # first find all of the relevant children
+            if self.kind in _CLASS_OR_STRUCT:
+                # first find all of the relevant children in a single pass
                 nested_class_like = []
                 nested_enums      = []
                 nested_unions     = []
+                buckets = {
+                    "class": nested_class_like,
+                    "struct": nested_class_like,
+                    "enum": nested_enums,
+                    "union": nested_unions
+                }
                 # important: only scan self.children, do not use recursive findNested* methods
                 for c in self.children:
-                    if c.kind == "struct" or c.kind == "class":
-                        nested_class_like.append(c)
-                    elif c.kind == "enum":
-                        nested_enums.append(c)
-                    elif c.kind == "union":
-                        nested_unions.append(c)
+                    bucket = buckets.get(c.kind)
+                    if bucket is not None:
+                        bucket.append(c)
 
                 # sort the lists we just found
                 nested_class_like.sort()
@@ -719,9 +1048,7 @@ class ExhaleNode(object):
                 nested_unions.sort()
 
                 # return a flattened listing with everything in the order it should be
-                return [
-                    child for child in itertools.chain(nested_class_like, nested_enums, nested_unions)
-                ]
+                return list(itertools.chain(nested_class_like, nested_enums, nested_unions))
             # namespaces include nested namespaces, and any top-level class_like, enums,
             # and unions.  include nested namespaces first
             elif self.kind == "namespace":
@@ -740,9 +1067,7 @@ class ExhaleNode(object):
                 nested_kids.sort()
 
                 # return a flattened listing with everything in the order it should be
-                return [
-                    child for child in itertools.chain(nested_nspaces, nested_kids)
-                ]
+                return nested_nspaces + nested_kids
             else:
                 # everything else is a terminal node
                 return []
@@ -763,16 +1088,66 @@ class ExhaleNode(object):
                 nested_kids.sort()
 
                 # return a flattened listing with everything in the order it should be
-                return [
-                    child for child in itertools.chain(nested_dirs, nested_kids)
-                ]
+                return nested_dirs + nested_kids
             else:
                 # files are terminal nodes in this hierarchy view
                 return []
         else:
             raise RuntimeError("{} is not a valid hierarchy type".format(hierarchyType))
 
-    def toHierarchy(self, hierarchyType, level, stream, lastChild=False):
+    def treeViewLink(self):
+        '''
+        The pieces of the hyperlink to this node used by the Tree Views.  They only
+        depend on ``file_name``, ``link_name`` and ``title``, which are final by the time
+        the hierarchies are generated, so they are computed on the first call and cached
+        in ``self.tree_view_link``.
+
+        :Return (tuple):
+            ``(href, qualifier, link_title, li_text)``, where ``link_title`` has already
+            been escaped for HTML and ``li_text`` is the ``qualifier`` followed by the
+            ``<a href>`` to this node.
+        '''
+        if self.tree_view_link is not None:
+            return self.tree_view_link
+
+        # turn double underscores into underscores, then underscores into hyphens
+        html_link = _LINK_ANCHOR_RE.sub("-", self.link_name)
+        # every generated file_name ends in ".rst", slice it off instead of splitting
+        file_base = self.file_name[:-4] if self.file_name.endswith(".rst") else self.file_name
+        href = f"{file_base}.html#{html_link}"
+
+        if self.kind != "page":
+            # should always have at least two parts (templates will have more)
+            title_as_link_parts = self.title.split(" ")
+            if self.template_params:
+                # E.g. 'Template Class Foo'
+                q_start = 0
+                q_end   = 2
+            else:
+                # E.g. 'Class Foo'
+                q_start = 0
+                q_end   = 1
+            # the qualifier will not be part of the hyperlink (for clarity of
+            # navigation), the link_title will be
+            qualifier   = " ".join(title_as_link_parts[q_start:q_end])
+            link_title  = " ".join(title_as_link_parts[q_end:])
+        else:
+            # E.g. 'Foo'
+            qualifier = ""
+            link_title = self.title
+
+        link_title  = html.escape(link_title, quote=False)
+        # the actual text / link inside of the list item
+        li_text     = '{qualifier} <a href="{href}">{link_title}</a>'.format(
+            qualifier=qualifier,
+            href=href,
+            link_title=link_title
+        )
+
+        self.tree_view_link = (href, qualifier, link_title, li_text)
+        return self.tree_view_link
+
+    def toHierarchy(self, hierarchyType, level, out, lastChild=False):
         '''
         **Parameters**
             ``hierarchyType`` (str)
@@ -783,8 +1158,9 @@ class ExhaleNode(object):
             ``level`` (int)
                 Recursion level used to determine indentation.
 
-            ``stream`` (StringIO)
-                The stream to write the contents to.
+            ``out`` (list)
+                The list of strings the contents are appended to.  The caller is
+                responsible for ``"".join``-ing them once the traversal is done.
 
             ``lastChild`` (bool)
                 When :data:`~exhale.configs.createTreeView` is ``True`` and
@@ -794,166 +1170,167 @@ class ExhaleNode(object):
 
         .. todo:: add thorough documentation of this
         '''
+        # The kind of output is fixed for the whole traversal, select it once rather
+        # than re-checking the configs for every node.
+        if not configs.createTreeView:
+            render = ExhaleNode._toHierarchyBulleted
+        elif configs.treeViewIsBootstrap:
+            render = ExhaleNode._toHierarchyBootstrap
+        else:
+            render = ExhaleNode._toHierarchyCollapsible
+
         # NOTE: indexpage needs to be treated specially, you need to include the
         # children at the *same* level, and not actually include indexpage.
         if hierarchyType == "page" and self.refid == "indexpage":
             nested_children = self.hierarchySortedDirectDescendants(hierarchyType)
             last_child_index = len(nested_children) - 1
-            child_idx        = 0
-            for child in nested_children:
-                child.toHierarchy(
-                    hierarchyType, level, stream, child_idx == last_child_index)
-                child_idx += 1
-            return
-        if self.inHierarchy(hierarchyType):
-            # For the Tree Views, we need to know if there are nested children before
-            # writing anything.  If there are, we need to open a new list
-            nested_children = self.hierarchySortedDirectDescendants(hierarchyType)
+            for child_idx, child in enumerate(nested_children):
+                render(child, hierarchyType, level, out, child_idx == last_child_index)
+        else:
+            render(self, hierarchyType, level, out, lastChild)
 
-            ############################################################################
-            # Write out this node.                                                     #
-            ############################################################################
-            # Easy case: just write another bullet point
-            if not configs.createTreeView:
-                stream.write("{indent}- :ref:`{link}`\n".format(
-                    indent='    ' * level,
-                    link=self.link_name
-                ))
-            # Otherwise, we're generating some raw HTML and/or JavaScript depending on
-            # whether we are using bootstrap or not
-            else:
-                # Declare the relevant links needed for the Tree Views
-                indent = "  " * (level * 2)
-                next_indent = "  {0}".format(indent)
-
-                # turn double underscores into underscores, then underscores into hyphens
-                html_link = self.link_name.replace("__", "_").replace("_", "-")
-                href = "{file}.html#{anchor}".format(
-                    file=self.file_name.rsplit(".rst", 1)[0],
-                    anchor=html_link
-                )
+    def _toHierarchyBulleted(self, hierarchyType, level, out, lastChild):
+        '''
+        :func:`~exhale.graph.ExhaleNode.toHierarchy` when
+        :data:`~exhale.configs.createTreeView` is ``False``: just write another bullet
+        point (``lastChild`` is irrelevant).
+        '''
+        # pre-order traversal with an explicit stack rather than recursion
+        stack = [(self, level)]
+        while stack:
+            node, level = stack.pop()
+            if not node.inHierarchy(hierarchyType):
+                continue
+            out.append(f"{_HIERARCHY_INDENT[level]}- :ref:`{node.link_name}`\n")
+            stack.extend(
+                (child, level + 1)
+                for child in reversed(node.hierarchySortedDirectDescendants(hierarchyType))
+            )
 
-                if self.kind != "page":
-                    # should always have at least two parts (templates will have more)
-                    title_as_link_parts = self.title.split(" ")
-                    if self.template_params:
-                        # E.g. 'Template Class Foo'
-                        q_start = 0
-                        q_end   = 2
-                    else:
-                        # E.g. 'Class Foo'
-                        q_start = 0
-                        q_end   = 1
-                    # the qualifier will not be part of the hyperlink (for clarity of
-                    # navigation), the link_title will be
-                    qualifier   = " ".join(title_as_link_parts[q_start:q_end])
-                    link_title  = " ".join(title_as_link_parts[q_end:])
-                else:
-                    # E.g. 'Foo'
-                    qualifier = ""
-                    link_title = self.title
-
-                link_title  = link_title.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                # the actual text / link inside of the list item
-                li_text     = '{qualifier} <a href="{href}">{link_title}</a>'.format(
-                    qualifier=qualifier,
-                    href=href,
-                    link_title=link_title
-                )
+    def _toHierarchyCollapsible(self, hierarchyType, level, out, lastChild):
+        '''
+        :func:`~exhale.graph.ExhaleNode.toHierarchy` for the collapsible lists Tree View,
+        writing raw HTML.
+        '''
+        # The traversal uses an explicit stack rather than recursion.  Entries are either
+        # a ``(node, level, lastChild)`` tuple to write, or the closing tags (a ``str``)
+        # of a node whose children have all been written.
+        stack = [(self, level, lastChild)]
+        while stack:
+            item = stack.pop()
+            if item.__class__ is str:
+                out.append(item)
+                continue
 
-                if configs.treeViewIsBootstrap:
-                    text = "text: \"<span class=\\\"{span_cls}\\\">{qualifier}</span> {link_title}\"".format(
-                        span_cls=configs.treeViewBootstrapTextSpanClass,
-                        qualifier=qualifier,
-                        link_title=link_title
+            node, level, lastChild = item
+            if not node.inHierarchy(hierarchyType):
+                continue
+            # For the Tree Views, we need to know if there are nested children before
+            # writing anything.  If there are, we need to open a new list
+            nested_children = node.hierarchySortedDirectDescendants(hierarchyType)
+
+            # Declare the relevant links needed for the Tree Views
+            indent = _HIERARCHY_INDENT[level]
+            next_indent = "  " + indent
+            li_text = node.treeViewLink()[3]
+            if lastChild:
+                opening_li = '<li class="lastChild">'
+            else:
+                opening_li = "<li>"
+
+            if nested_children:
+                # write this list element and begin the next list
+                # writes something like
+                #     <li>
+                #         some text with an href
+                #         <ul>
+                #
+                # the <ul> started here gets closed once the children are written
+                out.append(f"{indent}{opening_li}\n{next_indent}{li_text}\n{next_indent}<ul>\n")
+                stack.append(f"{next_indent}</ul>\n{indent}</li>\n")
+
+                # push the children in reverse so they are written in order
+                last_child_index = len(nested_children) - 1
+                for child_idx in range(last_child_index, -1, -1):
+                    stack.append(
+                        (nested_children[child_idx], level + 1, child_idx == last_child_index)
                     )
-                    link = "href: \"{href}\"".format(href=href)
-                    # write some json data, something like
-                    #     {
-                    #         text: "<span class=\\\"text-muted\\\"> some text",
-                    #         href: "link to actual item",
-                    #         selectable: false,
-                    stream.write("{indent}{{\n{next_indent}{text},\n".format(
-                        indent=indent,
-                        next_indent=next_indent,
-                        text=text
-                    ))
-                    stream.write("{next_indent}{link},\n{next_indent}selectable: false,\n".format(
-                        next_indent=next_indent,
-                        link=link
-                    ))
-                    # if requested, add the badge indicating how many children there are
-                    # only add this if there are children
-                    if configs.treeViewBootstrapUseBadgeTags and nested_children:
-                        stream.write("{next_indent}tags: ['{num_children}'],\n".format(
-                            next_indent=next_indent,
-                            num_children=len(nested_children)
-                        ))
+            else:
+                # write this list element and end it now (since no children)
+                # writes something like
+                #    <li>
+                #        some text with an href
+                #    </li>
+                out.append(f"{indent}{opening_li}{li_text}</li>\n")
+
+    def _toHierarchyBootstrap(self, hierarchyType, level, out, lastChild):
+        '''
+        :func:`~exhale.graph.ExhaleNode.toHierarchy` for the Bootstrap Tree View, writing
+        the JavaScript data for the tree (``lastChild`` is irrelevant).
+        '''
+        span_cls = configs.treeViewBootstrapTextSpanClass
+        use_badges = configs.treeViewBootstrapUseBadgeTags
+        # The traversal uses an explicit stack rather than recursion.  Entries are either
+        # a ``(node, level)`` tuple to write, or the closing brackets (a ``str``) of a
+        # node whose children have all been written.
+        stack = [(self, level)]
+        while stack:
+            item = stack.pop()
+            if item.__class__ is str:
+                out.append(item)
+                continue
 
-                    if nested_children:
-                        # If there are children then `nodes: [ ... ]` will be next
-                        stream.write("\n{next_indent}nodes: [\n".format(next_indent=next_indent))
-                    else:
-                        # Otherwise, this element is ending.  JavaScript doesn't care
-                        # about trailing commas :)
-                        stream.write("{indent}}},\n".format(indent=indent))
-                else:
-                    if lastChild:
-                        opening_li = '<li class="lastChild">'
-                    else:
-                        opening_li = "<li>"
+            node, level = item
+            if not node.inHierarchy(hierarchyType):
+                continue
+            # For the Tree Views, we need to know if there are nested children before
+            # writing anything.  If there are, we need to open a new list
+            nested_children = node.hierarchySortedDirectDescendants(hierarchyType)
+
+            # Declare the relevant links needed for the Tree Views
+            indent = _HIERARCHY_INDENT[level]
+            next_indent = "  " + indent
+            href, qualifier, link_title, _ = node.treeViewLink()
+            text = f"text: \"<span class=\\\"{span_cls}\\\">{qualifier}</span> {link_title}\""
+            link = f"href: \"{href}\""
+            # write some json data, something like
+            #     {
+            #         text: "<span class=\\\"text-muted\\\"> some text",
+            #         href: "link to actual item",
+            #         selectable: false,
+            out.append(f"{indent}{{\n{next_indent}{text},\n")
+            out.append(f"{next_indent}{link},\n{next_indent}selectable: false,\n")
+            # if requested, add the badge indicating how many children there are
+            # only add this if there are children
+            if use_badges and nested_children:
+                out.append(f"{next_indent}tags: ['{len(nested_children)}'],\n")
+
+            if nested_children:
+                # If there are children then `nodes: [ ... ]` will be next
+                out.append(f"\n{next_indent}nodes: [\n")
+
+                # close the `nodes: [ ... ]` and final } for element once the children
+                # are written.  The final comma IS necessary, and extra commas don't
+                # matter in javascript
+                stack.append(f"{next_indent}]\n{indent}}},\n")
+                stack.extend((child, level + 1) for child in reversed(nested_children))
+            else:
+                # Otherwise, this element is ending.  JavaScript doesn't care
+                # about trailing commas :)
+                out.append(f"{indent}}},\n")
 
-                    if nested_children:
-                        # write this list element and begin the next list
-                        # writes something like
-                        #     <li>
-                        #         some text with an href
-                        #         <ul>
-                        #
-                        # the <ul> started here gets closed below
-                        stream.write("{indent}{li}\n{next_indent}{li_text}\n{next_indent}<ul>\n".format(
-                            indent=indent,
-                            li=opening_li,
-                            next_indent=next_indent,
-                            li_text=li_text
-                        ))
-                    else:
-                        # write this list element and end it now (since no children)
-                        # writes something like
-                        #    <li>
-                        #        some text with an href
-                        #    </li>
-                        stream.write("{indent}{li}{li_text}</li>\n".format(
-                            indent=indent,
-                            li=opening_li,
-                            li_text=li_text
-                        ))
 
-            ############################################################################
-            # Write out all of the children (if there are any).                        #
-            ############################################################################
-            last_child_index = len(nested_children) - 1
-            child_idx        = 0
-            for child in nested_children:
-                child.toHierarchy(hierarchyType, level + 1, stream, child_idx == last_child_index)
-                child_idx += 1
-
-            ############################################################################
-            # If there were children, close the lists we started above.                #
-            ############################################################################
-            if configs.createTreeView and nested_children:
-                if configs.treeViewIsBootstrap:
-                    # close the `nodes: [ ... ]` and final } for element
-                    # the final comma IS necessary, and extra commas don't matter in javascript
-                    stream.write("{next_indent}]\n{indent}}},\n".format(
-                        next_indent=next_indent,
-                        indent=indent
-                    ))
-                else:
-                    stream.write("{next_indent}</ul>\n{indent}</li>\n".format(
-                        next_indent=next_indent,
-                        indent=indent
-                    ))
+class FileNode(ExhaleNode):
+    '''
+    An :class:`~exhale.graph.ExhaleNode` of kind ``"file"``, created automatically by
+    ``ExhaleNode(name, "file", refid)``.  Only file nodes need storage for the members
+    such as ``includes`` or ``program_listing`` documented in
+    :class:`~exhale.graph.ExhaleNode`, so they are not reserved on every other node.
+    '''
+    __slots__ = (
+        "namespaces_used", "includes", "included_by", "language", "program_listing",
+        "program_file", "program_link_name", "file_xml"
+    )
 
 
 class ExhaleRoot(object):
@@ -1011,9 +1388,10 @@ class ExhaleRoot(object):
             A list of all the Breathe compound objects discovered along the way.
             Populated during :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`.
 
-        ``all_nodes`` (list)
-            A list of all of the ExhaleNode objects created.  Populated during
-            :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`.
+        ``all_nodes`` (dict values view)
+            All of the ExhaleNode objects created, in the order they were discovered.
+            This is a read-only property over ``node_by_refid.values()``, nodes are
+            tracked by :func:`~exhale.graph.ExhaleRoot.trackNodeIfUnseen`.
 
         ``node_by_refid`` (dict)
             A dictionary with string ExhaleNode ``refid`` values, and values that are the
@@ -1085,9 +1463,9 @@ class ExhaleRoot(object):
 
         # track all compounds to build all nodes (ExhaleNodes)
         self.all_compounds = []##### update how this is used (compounds inserted are from xml parsing)
-        self.all_nodes = []
 
         # convenience lookup: keys are string Doxygen refid's, values are ExhaleNodes
+        # (this is also the storage behind `self.all_nodes`)
         self.node_by_refid = {}
 
         # breathe directive    breathe kind
@@ -1134,6 +1512,35 @@ class ExhaleRoot(object):
         # included in the page view hierarchy (indexpage is dumped right above)
         self.index_xml_page_ordering = []
 
+        # keys: breathe kind, values: the list above that partitionNodesByKind fills
+        self._by_kind = {
+            "class":     self.class_like,
+            "struct":    self.class_like,
+            "define":    self.defines,
+            "enum":      self.enums,
+            "enumvalue": self.enum_values,
+            "function":  self.functions,
+            "dir":       self.dirs,
+            "file":      self.files,
+            "group":     self.groups,
+            "namespace": self.namespaces,
+            "typedef":   self.typedefs,
+            "union":     self.unions,
+            "variable":  self.variables,
+            "page":      self.pages
+        }
+
+        # keys: leaf-like kind, values: see leafKindSections
+        self.leaf_kind_sections = {}
+
+    @property
+    def all_nodes(self):
+        '''
+        Every tracked ExhaleNode, in discovery order.  A view of
+        ``self.node_by_refid.values()`` rather than a separate list.
+        '''
+        return self.node_by_refid.values()
+
     ####################################################################################
     #
     ##
@@ -1152,11 +1559,12 @@ class ExhaleRoot(object):
 
         1. :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`
         2. :func:`~exhale.graph.ExhaleRoot.reparentAll`
-        3. Populate ``self.node_by_refid`` using ``self.all_nodes``.
-        4. :func:`~exhale.graph.ExhaleRoot.fileRefDiscovery`
-        5. :func:`~exhale.graph.ExhaleRoot.filePostProcess`
-        6. :func:`~exhale.graph.ExhaleRoot.parseFunctionSignatures`.
+        3. :func:`~exhale.graph.ExhaleRoot.fileRefDiscovery`
+        4. :func:`~exhale.graph.ExhaleRoot.filePostProcess`
+        5. :func:`~exhale.graph.ExhaleRoot.parseFunctionSignatures`.
+        6. Release the parsed Doxygen xml (``soup`` and ``cdef``) of every node.
         7. :func:`~exhale.graph.ExhaleRoot.sortInternals`
+        8. Freeze every node's ``children`` into a ``tuple``.
         '''
         self.discoverAllNodes()
         # now reparent everything we can
@@ -1164,11 +1572,6 @@ class ExhaleRoot(object):
         #       in that method we only want to consider direct descendants
         self.reparentAll()
 
-        # now that we have all of the nodes, store them in a convenient manner for refid
-        # lookup when parsing the Doxygen xml files
-        for n in self.all_nodes:
-            self.node_by_refid[n.refid] = n
-
         # find missing relationships using the Doxygen xml files
         self.fileRefDiscovery()
         self.filePostProcess()
@@ -1176,8 +1579,17 @@ class ExhaleRoot(object):
         # gather the function signatures
         self.parseFunctionSignatures()
 
+        # every pass over the Doxygen xml is done, release the (large) parsed trees
+        for n in self.all_nodes:
+            n.soup = None
+            n.cdef = None
+
         # sort all of the lists we just built
         self.sortInternals()
+        # the graph is complete, store the children compactly.  Generating the API
+        # caches results derived from them, so they must not be modified from now on
+        for n in self.all_nodes:
+            n.children = tuple(n.children)
 
     def discoverAllNodes(self):
         '''
@@ -1187,89 +1599,122 @@ class ExhaleRoot(object):
             configs._doxygen_xml_output_directory,
             "index.xml"
         )
-        try:
-            with codecs.open(doxygen_index_xml, "r", "utf-8") as index:
-                index_contents = index.read()
-        except:
+        if not os.path.isfile(doxygen_index_xml):
             raise RuntimeError("Could not read the contents of [{0}].".format(doxygen_index_xml))
 
+        # snapshot the xml directory once, rather than checking each {refid}.xml exists
+        configs._doxygen_xml_files = frozenset(
+            entry.name for entry in os.scandir(configs._doxygen_xml_output_directory) if entry.is_file()
+        )
+
+        # Stream the compounds out of index.xml rather than building the whole document,
+        # each <compound> is discarded as soon as its nodes have been tracked.  Recovering
+        # from malformed XML keeps the leniency of the BeautifulSoup parse this replaced.
+        compounds = etree.iterparse(
+            doxygen_index_xml, events=("end",), tag="compound", recover=True
+        )
         try:
-            index_soup = BeautifulSoup(index_contents, "lxml-xml")
-        except:
+            for _, compound in compounds:
+                curr_name  = compound.findtext("name")
+                curr_kind  = compound.get("kind")
+                curr_refid = compound.get("refid")
+                if curr_name is not None and curr_kind is not None and curr_refid is not None:
+                    # kinds are compared and refids are hashed constantly from here on,
+                    # intern them so that every node shares the same string objects
+                    curr_kind  = sys.intern(curr_kind)
+                    curr_refid = sys.intern(curr_refid)
+                    curr_node = self.trackNodeIfUnseen(ExhaleNode(curr_name, curr_kind, curr_refid))
+
+                    # For things like files and namespaces, a "member" list will include
+                    # things like defines, enums, etc.  For classes and structs, we don't
+                    # need to pay attention because the members are the various methods or
+                    # data members by the class
+                    if curr_kind in ["file", "namespace"]:
+                        for member in compound.iterfind("member"):
+                            child_name  = member.findtext("name")
+                            child_kind  = member.get("kind")
+                            child_refid = member.get("refid")
+                            if child_name is not None and child_kind is not None and child_refid is not None:
+                                child_kind  = sys.intern(child_kind)
+                                child_refid = sys.intern(child_refid)
+                                # members of a namespace are listed again by the file
+                                # declaring them, both must update the same node
+                                child_node = self.trackNodeIfUnseen(
+                                    ExhaleNode(child_name, child_kind, child_refid)
+                                )
+
+                                if curr_kind == "namespace":
+                                    child_node.parent = curr_node
+                                else:  # curr_kind == "file"
+                                    child_node.def_in_file = curr_node
+
+                                curr_node.children.append(child_node)
+
+                # free the compound and every (already processed) compound before it
+                compound.clear()
+                while compound.getprevious() is not None:
+                    del compound.getparent()[0]
+        except OSError:
+            raise RuntimeError("Could not read the contents of [{0}].".format(doxygen_index_xml))
+        except etree.XMLSyntaxError:
             raise RuntimeError("Could not parse the contents of [{0}] as an xml.".format(doxygen_index_xml))
 
-        doxygen_root = index_soup.doxygenindex
-        if not doxygen_root:
+        if compounds.root is None or compounds.root.tag != "doxygenindex":
             raise RuntimeError(
                 "Did not find root XML node named 'doxygenindex' parsing [{0}].".format(doxygen_index_xml)
             )
 
-        for compound in doxygen_root.find_all("compound"):
-            if compound.find("name") and "kind" in compound.attrs and "refid" in compound.attrs:
-                curr_name  = compound.find("name").get_text()
-                curr_kind  = compound.attrs["kind"]
-                curr_refid = compound.attrs["refid"]
-                curr_node  = ExhaleNode(curr_name, curr_kind, curr_refid)
-                self.trackNodeIfUnseen(curr_node)
-
-                # For things like files and namespaces, a "member" list will include
-                # things like defines, enums, etc.  For classes and structs, we don't
-                # need to pay attention because the members are the various methods or
-                # data members by the class
-                if curr_kind in ["file", "namespace"]:
-                    for member in compound.find_all("member"):
-                        if member.find("name") and "kind" in member.attrs and "refid" in member.attrs:
-                            child_name  = member.find("name").get_text()
-                            child_kind  = member.attrs["kind"]
-                            child_refid = member.attrs["refid"]
-                            child_node  = ExhaleNode(child_name, child_kind, child_refid)
-                            self.trackNodeIfUnseen(child_node)
-
-                            if curr_kind == "namespace":
-                                child_node.parent = curr_node
-                            else:  # curr_kind == "file"
-                                child_node.def_in_file = curr_node
-
-                            curr_node.children.append(child_node)
+        # every compound is known, fill the per-kind lists the passes below walk over
+        self.partitionNodesByKind()
 
+        # only format the (many) verboseBuild messages below when they will be printed
+        verbose = configs.verboseBuild
+        # doxygen's STRIP_FROM_PATH as an absolute path, see the page and file locations
+        abs_strip_path = _absStripPath()
         for page in self.pages:
-            node_xml_contents = utils.nodeCompoundXMLContents(page)
-            if node_xml_contents:
-                try:
-                    page.soup = BeautifulSoup(node_xml_contents, "lxml-xml")
-                except:
-                    utils.fancyError("Unable to parse file xml [{0}]:".format(page.name))
+            try:
+                # only the title, subpages and location are needed, skip building the
+                # (potentially large) rest of the page; nothing else uses the page xml
+                page_soup = None
+                page_xml_contents = utils.nodeCompoundXMLContents(page)
+                if page_xml_contents:
+                    page_soup = BeautifulSoup(
+                        page_xml_contents, utils.XML_PARSER, parse_only=_PAGE_STRAINER
+                    )
+            except:
+                utils.fancyError("Unable to parse file xml [{0}]:".format(page.name))
 
+            if page_soup is not None:
                 try:
-                    cdef = page.soup.doxygen.compounddef
-
-                    title = cdef.find("title")
+                    title = page_soup.find("title")
                     if title and title.string:
                         page.title = title.string
 
                     err_non = "[CRITICAL] did not find refid [{0}] in `self.node_by_refid`."
                     err_dup = "Conflicting page definition: [{0}] appears to be defined in both [{1}] and [{2}]."  # noqa
                     # process subpages
-                    inner_pages = cdef.find_all("innerpage", recursive=False)
+                    inner_pages = page_soup.find_all("innerpage", recursive=False)
 
-                    utils.verbose_log(
-                        "*** [{0}] had [{1}] innerpages found".format(page.name, len(inner_pages)),
-                        utils.AnsiColors.BOLD_MAGENTA
-                    )
+                    if verbose:
+                        utils.verbose_log(
+                            "*** [{0}] had [{1}] innerpages found".format(page.name, len(inner_pages)),
+                            utils.AnsiColors.BOLD_MAGENTA
+                        )
 
                     for subpage in inner_pages:
-                        if "refid" in subpage.attrs:
-                            refid = subpage.attrs["refid"]
+                        refid = subpage.get("refid")
+                        if refid is not None:
                             if refid in self.node_by_refid:
                                 node = self.node_by_refid[refid]
 
                                 # << verboseBuild
-                                utils.verbose_log(
-                                    "    - [{0}]".format(node.name),
-                                    utils.AnsiColors.BOLD_MAGENTA
-                                )
+                                if verbose:
+                                    utils.verbose_log(
+                                        "    - [{0}]".format(node.name),
+                                        utils.AnsiColors.BOLD_MAGENTA
+                                    )
 
-                                if node.parent:
+                                if node.parent and verbose:
                                     utils.verbose_log(
                                         err_dup.format(node.name, node.parent.name, page.name),
                                         utils.AnsiColors.BOLD_YELLOW
@@ -1280,18 +1725,17 @@ class ExhaleRoot(object):
                                     node.parent = page
                             else:
                                 # << verboseBuild
-                                utils.verbose_log(err_non.format(refid), utils.AnsiColors.BOLD_RED)
+                                if verbose:
+                                    utils.verbose_log(err_non.format(refid), utils.AnsiColors.BOLD_RED)
 
                     # the location of the page as determined by doxygen
-                    location = cdef.find("location")
-                    if location and "file" in location.attrs:
-                        location_str = os.path.normpath(location.attrs["file"])
+                    location = page_soup.find("location")
+                    location_file = location.get("file") if location else None
+                    if location_file is not None:
+                        location_str = os.path.normpath(location_file)
                         # some older versions of doxygen don't reliably strip from path
                         # so make sure to remove it
-                        abs_strip_path = os.path.normpath(os.path.abspath(
-                            configs.doxygenStripFromPath
-                        ))
-                        if location_str.startswith(abs_strip_path):
+                        if abs_strip_path and location_str.startswith(abs_strip_path):
                             location_str = os.path.relpath(location_str, abs_strip_path)
                         page.location = os.path.normpath(location_str)
 
@@ -1305,99 +1749,106 @@ class ExhaleRoot(object):
         # xml documents to determine where leaf-like nodes have been declared.
         #
         # TODO: change formatting of namespace to provide a listing of all files using it
-        for f in self.files:
-            node_xml_contents = utils.nodeCompoundXMLContents(f)
-            if node_xml_contents:
+        #
+        # The files are parsed independently of each other (and of any node), so parse
+        # them concurrently.  The result is kept on the file for the program listing
+        # pass below and fileRefDiscovery, the xml of a file is only parsed once.
+        with ThreadPoolExecutor() as executor:
+            parsed_files = []
+            for f in self.files:
+                node_xml_path = utils.nodeCompoundXMLPath(f)
+                parsed_files.append(executor.submit(_parseFileXml, node_xml_path) if node_xml_path else None)
+
+        for f, parsed in zip(self.files, parsed_files):
+            if parsed is not None:
                 try:
-                    f.soup = BeautifulSoup(node_xml_contents, "lxml-xml")
+                    f.file_xml = parsed.result()
                 except:
                     utils.fancyError("Unable to parse file xml [{0}]:".format(f.name))
 
+            file_xml = f.file_xml
+            if file_xml is not None:
                 try:
-                    cdef = f.soup.doxygen.compounddef
-
-                    if "language" in cdef.attrs:
-                        f.language = cdef.attrs["language"]
+                    if file_xml.language is not None:
+                        f.language = file_xml.language
 
                     err_non = "[CRITICAL] did not find refid [{0}] in `self.node_by_refid`."
                     err_dup = "Conflicting file definition: [{0}] appears to be defined in both [{1}] and [{2}]."  # noqa
                     # process classes
-                    inner_classes = cdef.find_all("innerclass", recursive=False)
-
                     # << verboseBuild
-                    utils.verbose_log(
-                        "*** [{0}] had [{1}] innerclasses found".format(f.name, len(inner_classes)),
-                        utils.AnsiColors.BOLD_MAGENTA
-                    )
+                    if verbose:
+                        utils.verbose_log(
+                            "*** [{0}] had [{1}] innerclasses found".format(
+                                f.name, len(file_xml.inner_classes)
+                            ),
+                            utils.AnsiColors.BOLD_MAGENTA
+                        )
 
-                    for class_like in inner_classes:
-                        if "refid" in class_like.attrs:
-                            refid = class_like.attrs["refid"]
+                    for refid, class_like in file_xml.inner_classes:
+                        if refid is not None:
                             if refid in self.node_by_refid:
                                 node = self.node_by_refid[refid]
 
                                 # << verboseBuild
-                                utils.verbose_log(
-                                    "    - [{0}]".format(node.name),
-                                    utils.AnsiColors.BOLD_MAGENTA
-                                )
+                                if verbose:
+                                    utils.verbose_log(
+                                        "    - [{0}]".format(node.name),
+                                        utils.AnsiColors.BOLD_MAGENTA
+                                    )
 
                                 if not node.def_in_file:
                                     node.def_in_file = f
                                 elif node.def_in_file != f:
                                     # << verboseBuild
-                                    utils.verbose_log(
-                                        err_dup.format(node.name, node.def_in_file.name, f.name),
-                                        utils.AnsiColors.BOLD_YELLOW
-                                    )
+                                    if verbose:
+                                        utils.verbose_log(
+                                            err_dup.format(node.name, node.def_in_file.name, f.name),
+                                            utils.AnsiColors.BOLD_YELLOW
+                                        )
                             else:
                                 # << verboseBuild
-                                utils.verbose_log(err_non.format(refid), utils.AnsiColors.BOLD_RED)
+                                if verbose:
+                                    utils.verbose_log(err_non.format(refid), utils.AnsiColors.BOLD_RED)
                         else:
                             # TODO: can this ever happen?
                             # << verboseBuild
                             catastrophe  = "CATASTROPHIC: doxygen xml for `{0}` found `innerclass` [{1}] that"
                             catastrophe += " does *NOT* have a `refid` attribute!"
-                            catastrophe  = catastrophe.format(f, str(class_like))
-                            utils.verbose_log(
-                                utils.prefix("(!) ", catastrophe),
-                                utils.AnsiColors.BOLD_RED
-                            )
+                            catastrophe  = catastrophe.format(f, class_like)
+                            if verbose:
+                                utils.verbose_log(
+                                    utils.prefix("(!) ", catastrophe),
+                                    utils.AnsiColors.BOLD_RED
+                                )
 
                     # try and find anything else
-                    memberdefs = cdef.find_all("memberdef", recursive=False)
-
                     # << verboseBuild
-                    utils.verbose_log(
-                        "*** [{0}] had [{1}] memberdef".format(f.name, len(memberdefs)),
-                        utils.AnsiColors.BOLD_MAGENTA
-                    )
+                    if verbose:
+                        utils.verbose_log(
+                            "*** [{0}] had [{1}] memberdef".format(f.name, len(file_xml.memberdef_ids)),
+                            utils.AnsiColors.BOLD_MAGENTA
+                        )
 
-                    for member in cdef.find_all("memberdef", recursive=False):
-                        if "id" in member.attrs:
-                            refid = member.attrs["id"]
-                            if refid in self.node_by_refid:
-                                node = self.node_by_refid[refid]
+                    for refid in file_xml.memberdef_ids:
+                        if refid in self.node_by_refid:
+                            node = self.node_by_refid[refid]
 
-                                # << verboseBuild
+                            # << verboseBuild
+                            if verbose:
                                 utils.verbose_log(
                                     "    - [{0}]".format(node.name),
                                     utils.AnsiColors.BOLD_MAGENTA
                                 )
 
-                                if not node.def_in_file:
-                                    node.def_in_file = f
+                            if not node.def_in_file:
+                                node.def_in_file = f
 
                     # the location of the file as determined by doxygen
-                    location = cdef.find("location")
-                    if location and "file" in location.attrs:
-                        location_str = os.path.normpath(location.attrs["file"])
+                    if file_xml.location is not None:
+                        location_str = file_xml.location
                         # some older versions of doxygen don't reliably strip from path
                         # so make sure to remove it
-                        abs_strip_path = os.path.normpath(os.path.abspath(
-                            configs.doxygenStripFromPath
-                        ))
-                        if location_str.startswith(abs_strip_path):
+                        if abs_strip_path and location_str.startswith(abs_strip_path):
                             location_str = os.path.relpath(location_str, abs_strip_path)
                         f.location = os.path.normpath(location_str)
 
@@ -1408,18 +1859,25 @@ class ExhaleRoot(object):
 
         ###### TODO: explain how the parsing works // move it to exhale.parse
         # last chance: we will still miss some, but need to pause and establish namespace relationships
+        # keys: location, values: the (first) file node at that location
+        file_by_location = {}
+        for f in self.files:
+            if f.location not in file_by_location:
+                file_by_location[f.location] = f
+        # keys: file node, values: set of its children, built when first needed
+        file_children = {}
         for nspace in self.namespaces:
-            node_xml_contents = utils.nodeCompoundXMLContents(nspace)
-            if node_xml_contents:
-                try:
-                    name_soup = BeautifulSoup(node_xml_contents, "lxml-xml")
-                except:
-                    continue
+            try:
+                name_soup = self.compoundSoup(nspace)
+            except:
+                continue
 
-                cdef = name_soup.doxygen.compounddef
+            if name_soup is not None:
+                # cached, parseFunctionSignatures needs it again for the namespace functions
+                cdef = nspace.cdef = name_soup.doxygen.compounddef
                 for class_like in cdef.find_all("innerclass", recursive=False):
-                    if "refid" in class_like.attrs:
-                        refid = class_like.attrs["refid"]
+                    refid = class_like.get("refid")
+                    if refid is not None:
                         if refid in self.node_by_refid:
                             node = self.node_by_refid[refid]
                             if node not in nspace.children:
@@ -1427,8 +1885,8 @@ class ExhaleRoot(object):
                                 node.parent = nspace
 
                 for nested_nspace in cdef.find_all("innernamespace", recursive=False):
-                    if "refid" in nested_nspace.attrs:
-                        refid = nested_nspace.attrs["refid"]
+                    refid = nested_nspace.get("refid")
+                    if refid is not None:
                         if refid in self.node_by_refid:
                             node = self.node_by_refid[refid]
                             if node not in nspace.children:
@@ -1438,28 +1896,32 @@ class ExhaleRoot(object):
                 # This is where things get interesting
                 for sectiondef in cdef.find_all("sectiondef", recursive=False):
                     for memberdef in sectiondef.find_all("memberdef", recursive=False):
-                        if "id" in memberdef.attrs:
-                            refid = memberdef.attrs["id"]
+                        refid = memberdef.get("id")
+                        if refid is not None:
                             if refid in self.node_by_refid:
                                 node = self.node_by_refid[refid]
                                 location = memberdef.find("location")
-                                if location and "file" in location.attrs:
-                                    filedef = os.path.normpath(location.attrs["file"])
-                                    for f in self.files:
-                                        if filedef == f.location:
-                                            node.def_in_file = f
-                                            if node not in f.children:
-                                                f.children.append(node)
-                                            break
+                                location_file = location.get("file") if location else None
+                                if location_file is not None:
+                                    filedef = os.path.normpath(location_file)
+                                    f = file_by_location.get(filedef)
+                                    if f is not None:
+                                        node.def_in_file = f
+                                        children = file_children.get(f)
+                                        if children is None:
+                                            children = file_children[f] = set(f.children)
+                                        if node not in children:
+                                            children.add(node)
+                                            f.children.append(node)
 
         # Find the nodes that did not have their file location definition assigned
         missing_file_def            = {} # keys: refid, values: ExhaleNode
-        missing_file_def_candidates = {} # keys: refid, values: ExhaleNode (file kind only!)
+        missing_file_def_candidates = {} # keys: refid, values: {ExhaleNode: None} (file kind only!)
         for refid in self.node_by_refid:
             node = self.node_by_refid[refid]
             if node.def_in_file is None and node.kind not in ("file", "dir", "group", "namespace", "enumvalue"):
                 missing_file_def[refid] = node
-                missing_file_def_candidates[refid] = []
+                missing_file_def_candidates[refid] = {}
 
         # Some compounds like class / struct have their own XML file and if documented
         # correctly will have a <location> tag.  For example, one may need to add the
@@ -1501,45 +1963,34 @@ class ExhaleRoot(object):
         refid_removals = []
         for refid in missing_file_def:
             node = missing_file_def[refid]
-            node_xml_contents = utils.nodeCompoundXMLContents(node)
+            location_file = utils.nodeCompoundLocationFile(node)
             # None is returned when no {refid}.xml exists (e.g., for enum or union).
-            if not node_xml_contents:
-                pass
+            if not location_file:
+                continue
 
-            try:
-                node_soup = BeautifulSoup(node_xml_contents, "lxml-xml")
-                cdef = node_soup.doxygen.compounddef
-                location = cdef.find("location", recursive=False)
-                if location and "file" in location.attrs:
-                    file_path = os.path.normpath(location["file"])
-                    for f in self.files:
-                        if f.location == file_path:
-                            node.def_in_file = f
-                            f.children.append(node)
-                            refid_removals.append(refid)
-            except:
-                pass
+            f = file_by_location.get(os.path.normpath(location_file))
+            if f is not None:
+                node.def_in_file = f
+                f.children.append(node)
+                refid_removals.append(refid)
 
         # We found the def_in_file, don't parse the programlisting for these nodes.
         for refid in refid_removals:
             del missing_file_def[refid]
 
         # Go through every file and see if the refid associated with a node missing a
-        # file definition location is present in the <programlisting>
-        for f in self.files:
-            cdef = f.soup.doxygen.compounddef
-            # try and find things in the programlisting as a last resort
-            programlisting = cdef.find("programlisting")
-            if programlisting:
-                for ref in programlisting.find_all("ref"):
-                    if "refid" in ref.attrs:
-                        refid = ref.attrs["refid"]
-                        # be careful not to just consider any refid found, e.g. don't
-                        # use the `compound` kindref's because those are just stating
-                        # it was used in this file, not that it was declared here
-                        if "kindref" in ref.attrs and ref.attrs["kindref"] == "member":
-                            if refid in missing_file_def and f not in missing_file_def_candidates[refid]:
-                                missing_file_def_candidates[refid].append(f)
+        # file definition location is present in the <programlisting>.  Be careful not
+        # to just consider any refid found, e.g. don't use the `compound` kindref's
+        # because those are just stating it was used in this file, not that it was
+        # declared here (only kindref="member" refids are returned).
+        if missing_file_def:
+            for f in self.files:
+                # try and find things in the programlisting as a last resort
+                if f.file_xml is None:
+                    continue
+                for refid in f.file_xml.member_refids:
+                    if refid in missing_file_def:
+                        missing_file_def_candidates[refid][f] = None
 
         # For every refid missing a file definition location, see if we found it only
         # once in a file node's <programlisting>.  If so, assign that as the file the
@@ -1549,7 +2000,7 @@ class ExhaleRoot(object):
             candidates = missing_file_def_candidates[refid]
             # If only one found, life is good!
             if len(candidates) == 1:
-                node.def_in_file = candidates[0]
+                node.def_in_file = next(iter(candidates))
                 # << verboseBuild
                 utils.verbose_log(utils.info(
                     "Manually setting file definition of {0} {1} to [{2}]".format(
@@ -1577,15 +2028,14 @@ class ExhaleRoot(object):
         # now that all nodes have been discovered, process template parameters, and
         # coordinate any base / derived inheritance relationships
         for node in self.class_like:
-            node_xml_contents = utils.nodeCompoundXMLContents(node)
-            if node_xml_contents:
-                try:
-                    name_soup = BeautifulSoup(node_xml_contents, "lxml-xml")
-                except:
-                    utils.fancyError("Could not process [{0}]".format(
-                        os.path.join(configs._doxygen_xml_output_directory, "{0}".format(node.refid))
-                    ))
+            try:
+                name_soup = self.compoundSoup(node)
+            except:
+                utils.fancyError("Could not process [{0}]".format(
+                    os.path.join(configs._doxygen_xml_output_directory, "{0}".format(node.refid))
+                ))
 
+            if name_soup is not None:
                 try:
                     cdef = name_soup.doxygen.compounddef
                     tparams = cdef.find("templateparamlist", recursive=False)
@@ -1624,11 +2074,8 @@ class ExhaleRoot(object):
                             # default template parameter is given.  This will ultimately
                             # mean that def_n is set to None for consistency.
                             if param_t.ref:
-                                if "refid" in param_t.ref.attrs:
-                                    refid = param_t.ref.attrs["refid"]
-                                else:
-                                    # I hope this never happens.
-                                    refid = None
+                                # None if there is no refid.  I hope this never happens.
+                                refid = param_t.ref.get("refid")
                                 param_t = (refid, param_t.ref.string)
                             else:
                                 param_t = (None, param_t.string)
@@ -1646,15 +2093,7 @@ class ExhaleRoot(object):
                             node.template_params.append((param_t, decl_n, def_n))
 
                     def prot_ref_str(soup_node):
-                        if "prot" in soup_node.attrs:
-                            prot = soup_node.attrs["prot"]
-                        else:
-                            prot = None
-                        if "refid" in soup_node.attrs:
-                            refid = soup_node.attrs["refid"]
-                        else:
-                            refid = None
-                        return (prot, refid, soup_node.string)
+                        return (soup_node.get("prot"), soup_node.get("refid"), soup_node.string)
 
                     # Now see if there is a reference to any base classes
                     for base in cdef.find_all("basecompoundref", recursive=False):
@@ -1666,48 +2105,68 @@ class ExhaleRoot(object):
                 except:
                     utils.fancyError("Error processing Doxygen XML for [{0}]".format(node.name), "txt")
 
+                # nothing after this needs the class xml, let go of it right away
+                node.soup = None
+
     def trackNodeIfUnseen(self, node):
         '''
-        Helper method for :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`.  If the node
-        is not in self.all_nodes yet, add it to both self.all_nodes as well as the
-        corresponding ``self.<breathe_kind>`` list.
+        Helper method for :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`.  If no node
+        with the same ``refid`` is tracked yet, add it to ``self.node_by_refid`` (and
+        therefore ``self.all_nodes``).  The ``self.<breathe_kind>`` lists are filled
+        afterward by :func:`~exhale.graph.ExhaleRoot.partitionNodesByKind`.
 
         :Parameters:
             ``node`` (ExhaleNode)
                 The node to begin tracking if not already present.
+
+        :Return (ExhaleNode):
+            The node tracked for ``node.refid``: ``node`` itself if it was unseen,
+            otherwise the node that was tracked first.
+        '''
+        seen = self.node_by_refid.get(node.refid)
+        if seen is not None:
+            return seen
+
+        node.set_owner(self)
+        self.node_by_refid[node.refid] = node
+        return node
+
+    def partitionNodesByKind(self):
+        '''
+        Helper method for :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`.  Once every
+        compound of ``index.xml`` has been tracked, sort the nodes into the
+        ``self.<breathe_kind>`` lists (and ``self.index_xml_page_ordering``) in a single
+        pass over ``self.node_by_refid``, preserving the order they were discovered in.
         '''
-        if node not in self.all_nodes:
-            node.set_owner(self)
-            self.all_nodes.append(node)
-            self.node_by_refid[node.refid] = node
-            if node.kind == "class" or node.kind == "struct":
-                self.class_like.append(node)
-            elif node.kind == "namespace":
-                self.namespaces.append(node)
-            elif node.kind == "enum":
-                self.enums.append(node)
-            elif node.kind == "enumvalue":
-                self.enum_values.append(node)
-            elif node.kind == "define":
-                self.defines.append(node)
-            elif node.kind == "file":
-                self.files.append(node)
-            elif node.kind == "dir":
-                self.dirs.append(node)
-            elif node.kind == "function":
-                self.functions.append(node)
-            elif node.kind == "variable":
-                self.variables.append(node)
-            elif node.kind == "group":
-                self.groups.append(node)
-            elif node.kind == "typedef":
-                self.typedefs.append(node)
-            elif node.kind == "union":
-                self.unions.append(node)
-            elif node.kind == "page":
-                self.pages.append(node)
-                if node.refid != "indexpage":
-                    self.index_xml_page_ordering.append(node)
+        by_kind = self._by_kind
+        for node in self.node_by_refid.values():
+            bucket = by_kind.get(node.kind)
+            if bucket is not None:
+                bucket.append(node)
+
+        self.index_xml_page_ordering.extend(
+            page for page in self.pages if page.refid != "indexpage"
+        )
+
+    def compoundSoup(self, node):
+        '''
+        Helper method for :func:`~exhale.graph.ExhaleRoot.discoverAllNodes` and
+        :func:`~exhale.graph.ExhaleRoot.parseFunctionSignatures`.  Parses the Doxygen
+        xml of ``node`` the first time it is requested, caching it in ``node.soup`` so
+        that every pass shares the same parse.
+
+        :Parameters:
+            ``node`` (ExhaleNode)
+                The node to get the parsed Doxygen xml of.
+
+        :Return (BeautifulSoup):
+            The parsed ``{node.refid}.xml``, or ``None`` if there is no such file.
+        '''
+        if node.soup is None:
+            node_xml_contents = utils.nodeCompoundXMLContents(node)
+            if node_xml_contents:
+                node.soup = BeautifulSoup(node_xml_contents, utils.XML_PARSER)
+        return node.soup
 
     def reparentAll(self):
         '''
@@ -1732,9 +2191,10 @@ class ExhaleRoot(object):
         # nested namespaces are not in self.namespaces.
         self.reparentNamespaces()
 
-        # make sure all children lists are unique (no duplicate children)
+        # make sure all children lists are unique (no duplicate children), keeping the
+        # order they were discovered in so the output does not depend on object ids
         for node in self.all_nodes:
-            node.children = list(set(node.children))
+            node.children = list(dict.fromkeys(node.children))
 
     def reparentUnions(self):
         '''
@@ -1749,21 +2209,21 @@ class ExhaleRoot(object):
         # unions declared in a class will not link to the individual union page, so
         # we will instead elect to remove these from the list of unions
         removals = []
+        # keys: names of potential parents, values: the first class_like or namespace
+        # node with that name (class_like take precedence)
+        parent_by_name = {}
+        for node in itertools.chain(self.class_like, self.namespaces):
+            if node.name not in parent_by_name:
+                parent_by_name[node.name] = node
         for u in self.unions:
-            parts = u.name.split("::")
-            if len(parts) >= 2:
+            if len(u.name_parts) >= 2:
                 # TODO: nested unions are not supported right now...
-                parent_name = "::".join(p for p in parts[:-1])
-                reparented  = False
+                parent_name = u.parent_qualname
                 # see if the name matches any potential parents
-                for node in itertools.chain(self.class_like, self.namespaces):
-                    if node.name == parent_name:
-                        node.children.append(u)
-                        u.parent = node
-                        reparented = True
-                        break
-                # if not reparented, try the namespaces
-                if reparented:
+                node = parent_by_name.get(parent_name)
+                if node is not None:
+                    node.children.append(u)
+                    u.parent = node
                     removals.append(u)
                 else:
                     # << verboseBuild
@@ -1773,8 +2233,9 @@ class ExhaleRoot(object):
                     )
 
         # remove the unions from self.unions that were declared in class_like objects
-        for rm in removals:
-            self.unions.remove(rm)
+        if removals:
+            removals = set(removals)
+            self.unions[:] = [u for u in self.unions if u not in removals]
 
     def reparentClassLike(self):
         '''
@@ -1787,30 +2248,35 @@ class ExhaleRoot(object):
         hierarchy is generated correctly.
         '''
         removals = []
+        # keys: names of potential parents, values: the first node with that name
+        class_like_by_name = {}
+        for parent_cl in self.class_like:
+            class_like_by_name.setdefault(parent_cl.name, parent_cl)
+        namespace_by_name = {}
+        for parent_nspace in self.namespaces:
+            namespace_by_name.setdefault(parent_nspace.name, parent_nspace)
+
         for cl in self.class_like:
-            parts = cl.name.split("::")
-            if len(parts) > 1:
-                parent_name = "::".join(parts[:-1])
+            if len(cl.name_parts) > 1:
+                parent_name = cl.parent_qualname
 
                 # Try and reparent to class_like first.  If it is a nested class then
                 # we remove from the top level self.class_like.
-                for parent_cl in self.class_like:
-                    if parent_cl.name == parent_name:
-                        parent_cl.children.append(cl)
-                        cl.parent = parent_cl
-                        removals.append(cl)
-                        break
+                parent_cl = class_like_by_name.get(parent_name)
+                if parent_cl is not None:
+                    parent_cl.children.append(cl)
+                    cl.parent = parent_cl
+                    removals.append(cl)
 
                 # Next, reparent to namespaces.  Do not delete from self.class_like.
-                for parent_nspace in self.namespaces:
-                    if parent_nspace.name == parent_name:
-                        parent_nspace.children.append(cl)
-                        cl.parent = parent_nspace
-                        break
+                parent_nspace = namespace_by_name.get(parent_name)
+                if parent_nspace is not None:
+                    parent_nspace.children.append(cl)
+                    cl.parent = parent_nspace
 
-        for rm in removals:
-            if rm in self.class_like:
-                self.class_like.remove(rm)
+        if removals:
+            removals = set(removals)
+            self.class_like[:] = [cl for cl in self.class_like if cl not in removals]
 
     def reparentDirectories(self):
         '''
@@ -1819,33 +2285,21 @@ class ExhaleRoot(object):
         ``self.dirs`` is added as a child to a different directory node, it is removed
         from the ``self.dirs`` list.
         '''
-        dir_parts = []
-        dir_ranks = []
-        for d in self.dirs:
-            parts = d.name.split(os.sep)
-            for p in parts:
-                if p not in dir_parts:
-                    dir_parts.append(p)
-            dir_ranks.append((len(parts), d))
-
-        traversal = sorted(dir_ranks)
-        removals = []
-        for rank, directory in reversed(traversal):
-            # rank one means top level directory
-            if rank < 2:
-                break
+        dir_by_path = {d.name: d for d in self.dirs}
+        removals = set()
+        for directory in self.dirs:
+            # a single path component means top level directory
+            if os.sep not in directory.name:
+                continue
             # otherwise, this is nested
-            for p_rank, p_directory in reversed(traversal):
-                if p_rank == rank - 1:
-                    if p_directory.name == os.path.dirname(directory.name):
-                        p_directory.children.append(directory)
-                        directory.parent = p_directory
-                        if directory not in removals:
-                            removals.append(directory)
-                        break
+            p_directory = dir_by_path.get(os.path.dirname(directory.name))
+            if p_directory is not None and p_directory is not directory:
+                p_directory.children.append(directory)
+                directory.parent = p_directory
+                removals.add(directory)
 
-        for rm in removals:
-            self.dirs.remove(rm)
+        if removals:
+            self.dirs[:] = [d for d in self.dirs if d not in removals]
 
     def renameToNamespaceScopes(self):
         '''
@@ -1860,10 +2314,10 @@ class ExhaleRoot(object):
         ``external::MAX_DEPTH``.
         '''
         for n in self.namespaces:
-            namespace_name = "{0}::".format(n.name)
+            namespace_name = n.name + "::"
             for child in n.children:
-                if namespace_name not in child.name:
-                    child.name = "{0}{1}".format(namespace_name, child.name)
+                if not child.name.startswith(namespace_name):
+                    child.name = namespace_name + child.name
 
     def reparentNamespaces(self):
         '''
@@ -1875,43 +2329,31 @@ class ExhaleRoot(object):
         :func:`~exhale.graph.ExhaleRoot.renameToNamespaceScopes` is called before this
         method.
         '''
-        namespace_parts = []
-        namespace_ranks = []
+        namespace_by_name = {}
         for n in self.namespaces:
-            parts = n.name.split("::")
-            for p in parts:
-                if p not in namespace_parts:
-                    namespace_parts.append(p)
-            namespace_ranks.append((len(parts), n))
+            namespace_by_name.setdefault(n.name, n)
 
-        traversal = sorted(namespace_ranks)
-        removals = []
-        for rank, namespace in reversed(traversal):
-            # rank one means top level namespace
-            if rank < 2:
+        for namespace in self.namespaces:
+            # a single name component means top level namespace
+            if len(namespace.name_parts) < 2:
                 continue
             # otherwise, this is nested
-            for p_rank, p_namespace in reversed(traversal):
-                if p_rank == rank - 1:
-                    if p_namespace.name == "::".join(namespace.name.split("::")[:-1]):
-                        p_namespace.children.append(namespace)
-                        namespace.parent = p_namespace
-                        if namespace not in removals:
-                            removals.append(namespace)
-                        continue
+            p_namespace = namespace_by_name.get(namespace.parent_qualname)
+            if p_namespace is not None:
+                p_namespace.children.append(namespace)
+                namespace.parent = p_namespace
 
-        removals = []
-        for nspace in self.namespaces:
-            if nspace.parent and nspace.parent.kind == "namespace" and nspace not in removals:
-                removals.append(nspace)
-
-        for rm in removals:
-            self.namespaces.remove(rm)
+        # nested namespaces now hang off of their parent namespace
+        self.namespaces[:] = [
+            nspace for nspace in self.namespaces
+            if not (nspace.parent and nspace.parent.kind == "namespace")
+        ]
 
     def fileRefDiscovery(self):
         '''
-        Finds the missing components for file nodes by parsing the Doxygen xml (which is
-        just the ``doxygen_output_dir/node.refid``).  Additional items parsed include
+        Finds the missing components for file nodes from their Doxygen xml (which is
+        just the ``doxygen_output_dir/node.refid``), parsed once by
+        :func:`~exhale.graph.ExhaleRoot.discoverAllNodes`.  Additional items parsed include
         adding items whose ``refid`` tag are used in this file, the <programlisting> for
         the file, what it includes and what includes it, as well as the location of the
         file (with respsect to the *Doxygen* root).
@@ -1937,61 +2379,28 @@ class ExhaleRoot(object):
         # parse the doxygen xml file and extract all refid's put in it
         # keys: file object, values: list of refid's
         doxygen_xml_file_ownerships = {}
-        # innerclass, innernamespace, etc
-        ref_regex    = re.compile(r'.*<inner.*refid="(\w+)".*')
-        # what files this file includes
-        inc_regex    = re.compile(r'.*<includes.*>(.+)</includes>')
-        # what files include this file
-        inc_by_regex = re.compile(r'.*<includedby refid="(\w+)".*>(.*)</includedby>')
-        # the actual location of the file
-        loc_regex    = re.compile(r'.*<location file="(.*)"/>')
 
+        # the xml of every file was parsed by discoverAllNodes, apply the rest of it
         for f in self.files:
-            doxygen_xml_file_ownerships[f] = []
-            try:
-                doxy_xml_path = os.path.join(configs._doxygen_xml_output_directory, "{0}.xml".format(f.refid))
-                with codecs.open(doxy_xml_path, "r", "utf-8") as doxy_file:
-                    processing_code_listing = False  # shows up at bottom of xml
-                    for line in doxy_file:
-                        # see if this line represents the location tag
-                        match = loc_regex.match(line)
-                        if match is not None:
-                            f.location = os.path.normpath(match.groups()[0])
-                            continue
-
-                        if not processing_code_listing:
-                            # gather included by references
-                            match = inc_by_regex.match(line)
-                            if match is not None:
-                                ref, name = match.groups()
-                                f.included_by.append((ref, name))
-                                continue
-                            # gather includes lines
-                            match = inc_regex.match(line)
-                            if match is not None:
-                                inc = match.groups()[0]
-                                f.includes.append(inc)
-                                continue
-                            # gather any classes, namespaces, etc declared in the file
-                            match = ref_regex.match(line)
-                            if match is not None:
-                                match_refid = match.groups()[0]
-                                if match_refid in self.node_by_refid:
-                                    doxygen_xml_file_ownerships[f].append(match_refid)
-                                continue
-                            # lastly, see if we are starting the code listing
-                            if "<programlisting>" in line:
-                                processing_code_listing = True
-                        elif processing_code_listing:
-                            if "</programlisting>" in line:
-                                processing_code_listing = False
-                            else:
-                                f.program_listing.append(line)
-            except:
+            file_xml = f.file_xml
+            if file_xml is None:
                 utils.fancyError(
                     "Unable to process doxygen xml for file [{0}].\n".format(f.name)
                 )
 
+            if file_xml.location is not None:
+                f.location = file_xml.location
+            f.included_by.extend(file_xml.included_by)
+            f.includes.extend(file_xml.includes)
+            # gather any classes, namespaces, etc declared in the file
+            doxygen_xml_file_ownerships[f] = [
+                refid for refid in file_xml.inner_refids if refid in self.node_by_refid
+            ]
+            if file_xml.program_listing:
+                f.program_listing = file_xml.program_listing
+            # nothing after this needs the file xml, let go of it right away
+            f.file_xml = None
+
         #
         # IMPORTANT: do not set the parent field of anything being added as a child to the file
         #
@@ -1999,15 +2408,13 @@ class ExhaleRoot(object):
         # hack to make things work right on RTD
         # TODO: do this at construction rather than as a post process!
         if configs.doxygenStripFromPath is not None:
+            abs_strip_path = _absStripPath()
             for node in itertools.chain(self.files, self.dirs):
                 if node.kind == "file":
                     manip = node.location
                 else:  # node.kind == "dir"
                     manip = node.name
 
-                abs_strip_path = os.path.normpath(os.path.abspath(
-                    configs.doxygenStripFromPath
-                ))
                 if manip.startswith(abs_strip_path):
                     manip = os.path.relpath(manip, abs_strip_path)
 
@@ -2019,15 +2426,20 @@ class ExhaleRoot(object):
 
         # now that we have parsed all the listed refid's in the doxygen xml, reparent
         # the nodes that we care about
-        allowable_child_kinds = ["struct", "class", "function", "typedef", "define", "enum", "union"]
+        # keys: file node, values: set of f.children (for the membership tests below)
+        file_children = {}
         for f in self.files:
+            children = file_children[f] = set(f.children)
+            namespaces_used = set(f.namespaces_used)
             for match_refid in doxygen_xml_file_ownerships[f]:
                 child = self.node_by_refid[match_refid]
-                if child.kind in allowable_child_kinds:
-                    if child not in f.children:
+                if child.kind in _FILE_OWNED_KINDS:
+                    if child not in children:
+                        children.add(child)
                         f.children.append(child)
                 elif child.kind == "namespace":
-                    if child not in f.namespaces_used:
+                    if child not in namespaces_used:
+                        namespaces_used.add(child)
                         f.namespaces_used.append(child)
 
         # last but not least, some different kinds declared in the file that are scoped
@@ -2036,17 +2448,24 @@ class ExhaleRoot(object):
             potential_orphans = []
             for n in f.namespaces_used:
                 for child in n.children:
-                    if child.kind == "enum"     or child.kind == "variable" or \
-                       child.kind == "function" or child.kind == "typedef"  or \
-                       child.kind == "union":
+                    if child.kind in _ORPHAN_KINDS:
                         potential_orphans.append(child)
 
             # now that we have a list of potential orphans, see if this doxygen xml had
-            # the refid of a given child present.
+            # the refid of a given child present.  The listing is only tokenized once,
+            # and only if an orphan has a refid from this file.
+            listing = None
+            listing_tokens = None
             for orphan in potential_orphans:
-                unresolved_name = orphan.name.split("::")[-1]
-                if f.refid in orphan.refid and any(unresolved_name in line for line in f.program_listing):
-                    if orphan not in f.children:
+                if f.refid not in orphan.refid:
+                    continue
+                if listing is None:
+                    listing = "".join(f.program_listing)
+                    listing_tokens = utils.programListingTokens(listing)
+                if utils.programListingMentions(orphan.name_parts[-1], listing, listing_tokens):
+                    children = file_children[f]
+                    if orphan not in children:
+                        children.add(orphan)
                         f.children.append(orphan)
 
         # Last but not least, make sure all children know where they were defined.
@@ -2074,16 +2493,13 @@ class ExhaleRoot(object):
         # directories are already reparented, traverse the children and get a flattened
         # list of all directories. previously, all directories should have had their
         # names adjusted to remove a potentially leading path separator
-        nodes_remaining = [d for d in self.dirs]
-        all_directories = []
-        while len(nodes_remaining) > 0:
+        nodes_remaining = list(self.dirs)
+        # keys: directory name, values: the directory node
+        dir_by_path = {}
+        while nodes_remaining:
             d = nodes_remaining.pop()
-            all_directories.append(d)
-            for child in d.children:
-                if child.kind == "dir":
-                    nodes_remaining.append(child)
-
-        all_directories.sort()
+            dir_by_path.setdefault(d.name, d)
+            nodes_remaining.extend(child for child in d.children if child.kind == "dir")
 
         for f in self.files:
             if not f.location:
@@ -2103,16 +2519,11 @@ class ExhaleRoot(object):
                 )
                 continue
 
-            dirname = os.path.dirname(f.location)
-            found = False
-            for d in all_directories:
-                if dirname == d.name:
-                    d.children.append(f)
-                    f.parent = d
-                    found = True
-                    break
-
-            if not found:
+            d = dir_by_path.get(os.path.dirname(f.location))
+            if d is not None:
+                d.children.append(f)
+                f.parent = d
+            else:
                 sys.stderr.write(utils.critical(
                     "Could not find directory parent of file [{0}] with location [{1}].\n".format(
                         f.name, f.location
@@ -2160,19 +2571,21 @@ class ExhaleRoot(object):
         # TODO: setwise comparison / report when children vs parent_to_func[refid] differ?
         for refid in parent_to_func:
             parent = self.node_by_refid[refid]
-            parent_contents = utils.nodeCompoundXMLContents(parent)
-            if not parent_contents:
-                continue  ############flake8efphase: TODO: error, log?
-
-            try:
-                parent_soup = BeautifulSoup(parent_contents, "lxml-xml")
-            except:
-                continue
+            # namespaces kept their <compounddef> from discoverAllNodes
+            cdef = parent.cdef
+            if cdef is None:
+                try:
+                    parent_soup = self.compoundSoup(parent)
+                except:
+                    continue
+
+                if parent_soup is None:
+                    continue  ############flake8efphase: TODO: error, log?
 
-            cdef = parent_soup.doxygen.compounddef
+                cdef = parent_soup.doxygen.compounddef
             func_section = None
             for section in cdef.find_all("sectiondef", recursive=False):
-                if "kind" in section.attrs and section.attrs["kind"] == "func":
+                if section.get("kind") == "func":
                     func_section = section
                     break
 
@@ -2181,7 +2594,7 @@ class ExhaleRoot(object):
 
             functions = parent_to_func[refid]
             for memberdef in func_section.find_all("memberdef", recursive=False):
-                if "kind" not in memberdef.attrs or memberdef.attrs["kind"] != "function":
+                if memberdef.get("kind") != "function":
                     continue
 
                 func_refid = memberdef.attrs["id"]
@@ -2226,6 +2639,10 @@ class ExhaleRoot(object):
         appear before classes in listings).  Some internal lists are just sorted, and
         some are deep sorted (:func:`~exhale.graph.ExhaleRoot.deepSortList`).
         '''
+        # all names are final now, only compute the sort key once per node
+        for node in self.all_nodes:
+            node.sort_key = node.computeSortKey()
+
         # some of the lists only need to be sorted, some of them need to be sorted and
         # have each node sort its children
         # leaf-like lists: no child sort
@@ -2367,11 +2784,36 @@ class ExhaleRoot(object):
 
         self.adjustFunctionTitles()
 
+        # the kind dependent parts of the leaf-like documents, see leafKindSections
+        for kind in utils.LEAF_LIKE_KINDS:
+            heading = "{kind} Documentation".format(kind=utils.qualifyKind(kind))
+            self.leaf_kind_sections[kind] = (
+                _SECTION_HEADING_TMPL.format(
+                    heading=heading,
+                    heading_mark=utils.heading_mark(
+                        heading,
+                        configs.SUB_SECTION_HEADING_CHAR
+                    )
+                ),
+                utils.kindAsBreatheDirective(kind),
+                utils.prefix(
+                    "   ",
+                    "\n".join(spec for spec in utils.specificationsForKind(kind))
+                )
+            )
+
         # now that all potential ``node.link_name`` members are initialized, generate
-        # the leaf-like documents
-        for node in self.all_nodes:
-            if node.kind in utils.LEAF_LIKE_KINDS:
-                self.generateSingleNodeRST(node)
+        # the leaf-like documents.  Each one only reads the (complete) graph and writes
+        # its own file, so they are written concurrently.  The diagnostics of every
+        # document are reported afterward, in order, so the build log is reproducible.
+        with ThreadPoolExecutor() as executor:
+            all_diagnostics = list(executor.map(
+                self.generateSingleNodeRST,
+                [node for node in self.all_nodes if node.kind in utils.LEAF_LIKE_KINDS]
+            ))
+        for diagnostics in all_diagnostics:
+            for report in diagnostics:
+                report()
 
         self.generatePageDocuments()
 
@@ -2414,16 +2856,15 @@ class ExhaleRoot(object):
         # namespace directive.  As such, where possible, the filename should be as
         # human-friendly has possible so that users can conveniently link to the
         # internal Exhal ref's using e.g. :ref:`file_dir_subdir_filename.h`.
-        SPECIAL_CASES = ["dir", "file", "namespace", "page"]
-        if node.kind in SPECIAL_CASES:
+        if node.kind in _SPECIAL_CASE_KINDS:
             if node.kind == "file":
                 unique_id = node.location
             else:
                 unique_id = node.name
 
-            unique_id = unique_id.replace(":", "_").replace(os.sep, "_").replace(" ", "_")
+            unique_id = unique_id.translate(_UNIQUE_ID_TABLE)
             if node.kind == "namespace":
-                title = node.name.split("::")[-1]
+                title = node.name_parts[-1]
             else:
                 # NOTE: for files, node.name := basename(node.location) aka don't matter
                 title = os.path.basename(node.name)
@@ -2499,29 +2940,26 @@ class ExhaleRoot(object):
                         utils.fancyError(
                             f"Exhale does not know how to process {node.name}, "
                             f"tokenized to {template_tokens}.  Please report this bug.")
-                class_name = class_name.split("::")[-1]
+                class_name = class_name.rpartition("::")[2]
 
                 # Join up the final class name and any potentially skipped templates.
                 title = utils.join_template_tokens([class_name] + skipped)
             else:
-                title = node.name.split("::")[-1]
+                title = node.name_parts[-1]
 
             # additionally, I feel that nested classes should have their fully qualified
             # name without namespaces for clarity
             prepend_parent = False
-            if node.kind in ["class", "struct", "enum", "union"]:
-                if node.parent is not None and node.parent.kind in ["class", "struct"]:
+            if node.kind in _CLASS_HIERARCHY_KINDS:
+                if node.parent is not None and node.parent.kind in _CLASS_OR_STRUCT:
                     prepend_parent = True
             if prepend_parent:
-                title = "{parent}::{child}".format(
-                    parent=node.parent.name.split("::")[-1],
-                    child=title
-                )
+                title = f"{node.parent.name_parts[-1]}::{title}"
 
         # `unique_id` and `title` should be set approriately for all nodes by this point
-        if node.kind in SPECIAL_CASES:
-            node.link_name = "{kind}_{id}".format(kind=node.kind, id=unique_id)
-            node.file_name = "{link_name}.rst".format(link_name=node.link_name)
+        if node.kind in _SPECIAL_CASE_KINDS:
+            node.link_name = f"{node.kind}_{unique_id}"
+            node.file_name = f"{node.link_name}.rst"
             # Like the tree view documents, we want to .. include:: the indexpage on
             # the root library document without having sphinx generate html for the page
             # that is being included (otherwise there are duplicate label warnings).
@@ -2541,45 +2979,34 @@ class ExhaleRoot(object):
             # file that defined it).  So a little bit of trickery is used to make sure
             # that the generated filename is at least _somewhat_ understandable for a
             # human to know what it is documenting (or at least its kind...).
-            node.link_name = "exhale_{kind}_{id}".format(kind=node.kind, id=unique_id)
+            node.link_name = f"exhale_{node.kind}_{unique_id}"
             if unique_id.startswith(node.kind):
-                node.file_name = "{id}.rst".format(id=unique_id)
+                node.file_name = f"{unique_id}.rst"
             else:
-                node.file_name = "{kind}_{id}.rst".format(kind=node.kind, id=unique_id)
+                node.file_name = f"{node.kind}_{unique_id}.rst"
 
         # Make sure this file can always be generated.  We do not need to change the
         # node.link_name, just make sure the file being written to is OK.
         if len(node.file_name) >= configs.MAXIMUM_FILENAME_LENGTH:
             # hashlib.sha1 will produce a length 40 string.
-            node.file_name = "{kind}_{sha1}.rst".format(
-                kind=node.kind, sha1=hashlib.sha1(node.link_name.encode()).hexdigest()
-            )
+            node.file_name = f"{node.kind}_{hashlib.sha1(node.link_name.encode()).hexdigest()}.rst"
 
         # Create the program listing internal link and filename.
         if node.kind == "file":
-            node.program_link_name = "program_listing_{link_name}".format(link_name=node.link_name)
-            node.program_file = "{pl_link_name}.rst".format(pl_link_name=node.program_link_name)
+            node.program_link_name = f"program_listing_{node.link_name}"
+            node.program_file = f"{node.program_link_name}.rst"
 
             # Adding a 'program_listing_' prefix may have made this too long.  If so,
             # change both node.file_name and node.program_file for consistency.
             if len(node.program_file) >= configs.MAXIMUM_FILENAME_LENGTH:
                 sha1 = hashlib.sha1(node.link_name.encode()).hexdigest()
-                node.file_name = "{kind}_{sha1}.rst".format(kind=node.kind, sha1=sha1)
-                node.program_file = "program_listing_{file_name}".format(file_name=node.file_name)
+                node.file_name = f"{node.kind}_{sha1}.rst"
+                node.program_file = f"program_listing_{node.file_name}"
 
         # Now force everything in the containment folder
-        for attr in ["file_name", "program_file"]:
-            if hasattr(node, attr):
-                full_path = os.path.join(self.root_directory, getattr(node, attr))
-                if platform.system() == "Windows" and len(full_path) >= configs.MAXIMUM_WINDOWS_PATH_LENGTH:
-                    # NOTE: self.root_directory is *ALREADY* an absolute path, this
-                    #       prefix requires absolute paths!  See documentation for
-                    #       configs.MAXIMUM_WINDOWS_PATH_LENGTH.
-                    full_path = "{magic}{full_path}".format(
-                        magic="{slash}{slash}?{slash}".format(slash="\\"),  # \\?\ I HATE YOU WINDOWS
-                        full_path=full_path
-                    )
-                setattr(node, attr, full_path)
+        node.file_name = self.containedPath(node.file_name)
+        if node.kind == "file":
+            node.program_file = self.containedPath(node.program_file)
 
         #flake8failhereplease: add a test with decltype!
         # account for decltype(&T::var) etc, could be in name or template params
@@ -2589,18 +3016,38 @@ class ExhaleRoot(object):
 
         # breathe does not prepend the namespace for variables and typedefs, so
         # I choose to leave the fully qualified name in the title for added clarity
-        if node.kind in ["variable", "typedef"]:
+        if node.kind == "variable" or node.kind == "typedef":
             title = node.name
 
         # Last but not least, set the title for the page to be generated.
         if node.kind != "page":
-            node.title = "{kind} {title}".format(
-                kind=utils.qualifyKind(node.kind),
-                title=title
-            )
+            node.title = f"{utils.qualifyKind(node.kind)} {title}"
         if node.template_params or template_special:
-            node.title = "Template {title}".format(
-                title=node.title.replace('*', r'\*'))
+            node.title = "Template " + node.title.replace('*', r'\*')
+
+    def containedPath(self, file_name):
+        '''
+        Helper method for :func:`~exhale.graph.ExhaleRoot.initializeNodeFilenameAndLink`.
+        Places ``file_name`` in ``self.root_directory``, using the extended-length path
+        prefix on Windows when the path would otherwise be too long.
+
+        :Parameters:
+            ``file_name`` (str)
+                The name of the file to generate, relative to the containment folder.
+
+        :Return (str):
+            The path to generate ``file_name`` at.
+        '''
+        full_path = os.path.join(self.root_directory, file_name)
+        if _IS_WINDOWS and len(full_path) >= configs.MAXIMUM_WINDOWS_PATH_LENGTH:
+            # NOTE: self.root_directory is *ALREADY* an absolute path, this
+            #       prefix requires absolute paths!  See documentation for
+            #       configs.MAXIMUM_WINDOWS_PATH_LENGTH.
+            full_path = "{magic}{full_path}".format(
+                magic="{slash}{slash}?{slash}".format(slash="\\"),  # \\?\ I HATE YOU WINDOWS
+                full_path=full_path
+            )
+        return full_path
 
     def adjustFunctionTitles(self):
         # keys: string (func.name)
@@ -2701,6 +3148,26 @@ class ExhaleRoot(object):
                         ''')
                     ))
 
+    def leafKindSections(self, kind):
+        '''
+        The parts of a leaf-like document that only depend on the ``kind`` of the node
+        (and the configuration of this run).  These are computed for every kind in
+        :data:`~exhale.utils.LEAF_LIKE_KINDS` by
+        :func:`~exhale.graph.ExhaleRoot.generateNodeDocuments` before any document is
+        written, so this is only a lookup in ``self.leaf_kind_sections``.
+
+        :Parameters:
+            ``kind`` (str)
+                The kind of the node being generated by
+                :func:`~exhale.graph.ExhaleRoot.generateSingleNodeRST`.
+
+        :Return (tuple):
+            ``(heading, directive, specifications)``: the formatted
+            "<Kind> Documentation" section heading, the Breathe directive name, and the
+            indented directive specifications.
+        '''
+        return self.leaf_kind_sections[kind]
+
     def generateSingleNodeRST(self, node):
         '''
         Creates the reStructuredText document for the leaf like node object.
@@ -2712,9 +3179,17 @@ class ExhaleRoot(object):
         :Parameters:
             ``node`` (ExhaleNode)
                 The leaf like node being generated by this method.
+
+        :Return (list):
+            The diagnostics of this document, callables that write a message to
+            ``sys.stderr``.  This method may run in a worker thread, the caller is
+            responsible for reporting them.
         '''
+        diagnostics = []
         try:
             with codecs.open(node.file_name, "w", "utf-8") as gen_file:
+                # the document is assembled in memory and written out in one call
+                doc = []
                 ########################################################################
                 # Page header / linking.                                               #
                 ########################################################################
@@ -2726,24 +3201,16 @@ class ExhaleRoot(object):
                     defined_in = "- Defined in :ref:`{where}`".format(where=node.def_in_file.link_name)
                 else:
                     defined_in = ".. did not find file this was defined in"
-                    sys.stderr.write(utils.critical(
+                    diagnostics.append(functools.partial(sys.stderr.write, utils.critical(
                         "Did not locate file that defined {0} [{1}]; no link generated.\n".format(node.kind,
                                                                                                   node.name)
-                    ))
+                    )))
 
                 # Add the metadata if they requested it
                 if configs.pageLevelConfigMeta:
-                    gen_file.write("{0}\n\n".format(configs.pageLevelConfigMeta))
-
-                gen_file.write(textwrap.dedent('''\
-                    {link}
-
-                    {heading}
-                    {heading_mark}
+                    doc.append("{0}\n\n".format(configs.pageLevelConfigMeta))
 
-                    {defined_in}
-
-                '''.format(
+                doc.append(_LEAF_HEADER_TMPL.format(
                     link=link_declaration,
                     heading=node.title,
                     heading_mark=utils.heading_mark(
@@ -2751,11 +3218,11 @@ class ExhaleRoot(object):
                         configs.SECTION_HEADING_CHAR
                     ),
                     defined_in=defined_in
-                )))
+                ))
 
                 contents = utils.contentsDirectiveOrNone(node.kind)
                 if contents:
-                    gen_file.write(contents)
+                    doc.append(contents)
 
                 ########################################################################
                 # Nested relationships.                                                #
@@ -2772,17 +3239,15 @@ class ExhaleRoot(object):
                 # if this has nested types, link to them
                 nested_defs = None
                 if node.kind == "class" or node.kind == "struct":
-                    nested_children = []
-                    for c in node.children:
-                        c.findNestedEnums(nested_children)
-                        c.findNestedUnions(nested_children)
-                        c.findNestedClassLike(nested_children)
+                    # order is irrelevant, these are sorted by name below.  One traversal
+                    # of node collects every nested type, node itself is always first.
+                    nested_children = list(node.nestedOfKinds(_CLASS_HIERARCHY_KINDS)[1:])
 
                     if nested_children:
                         # build up a list of links, custom sort function will force
                         # double nested and beyond to appear after their parent by
                         # sorting on their name
-                        nested_children.sort(key=lambda x: x.name)
+                        nested_children.sort(key=operator.attrgetter("name"))
                         nested_child_stream = StringIO()
                         for nc in nested_children:
                             nested_child_stream.write("- :ref:`{0}`\n".format(nc.link_name))
@@ -2791,36 +3256,28 @@ class ExhaleRoot(object):
                         nested_child_string = nested_child_stream.getvalue()
                         nested_child_stream.close()
                         heading = "Nested Types"
-                        nested_defs = textwrap.dedent('''
-                            {heading}
-                            {heading_mark}
-
-                        '''.format(
+                        nested_defs = _SECTION_HEADING_TMPL.format(
                             heading=heading,
                             heading_mark=utils.heading_mark(
                                 heading,
                                 configs.SUB_SUB_SECTION_HEADING_CHAR
                             )
-                        ))
+                        )
                         nested_defs = "{0}{1}\n".format(nested_defs, nested_child_string)
 
                 if nested_type_of or nested_defs:
                     heading = "Nested Relationships"
-                    gen_file.write(textwrap.dedent('''
-                        {heading}
-                        {heading_mark}
-
-                    '''.format(
+                    doc.append(_SECTION_HEADING_TMPL.format(
                         heading=heading,
                         heading_mark=utils.heading_mark(
                             heading,
                             configs.SUB_SECTION_HEADING_CHAR
                         )
-                    )))
+                    ))
                     if nested_type_of:
-                        gen_file.write("{0}\n\n".format(nested_type_of))
+                        doc.append("{0}\n\n".format(nested_type_of))
                     if nested_defs:
-                        gen_file.write(nested_defs)
+                        doc.append(nested_defs)
 
                 ########################################################################
                 # Inheritance relationships.                                           #
@@ -2828,34 +3285,27 @@ class ExhaleRoot(object):
                 ##### remove this duplicated nonsense someday
                 if node.base_compounds or node.derived_compounds:
                     heading = "Inheritance Relationships"
-                    gen_file.write(textwrap.dedent('''
-                        {heading}
-                        {heading_mark}
-                    '''.format(
+                    doc.append(_INHERITANCE_HEADING_TMPL.format(
                         heading=heading,
                         heading_mark=utils.heading_mark(
                             heading,
                             configs.SUB_SECTION_HEADING_CHAR
                         )
-                    )))
+                    ))
                     if node.base_compounds:
                         if len(node.base_compounds) == 1:
                             title = "Base Type"
                         else:
                             title = "Base Types"
 
-                        gen_file.write(textwrap.dedent('''
-                            {heading}
-                            {heading_mark}
-
-                        '''.format(
+                        doc.append(_SECTION_HEADING_TMPL.format(
                             heading=title,
                             heading_mark=utils.heading_mark(
                                 title,
                                 configs.SUB_SUB_SECTION_HEADING_CHAR
                             )
-                        )))
-                        gen_file.write("{0}\n".format(node.baseOrDerivedListString(
+                        ))
+                        doc.append("{0}\n".format(node.baseOrDerivedListString(
                             node.base_compounds, self.node_by_refid
                         )))
                     if node.derived_compounds:
@@ -2863,18 +3313,14 @@ class ExhaleRoot(object):
                             title = "Derived Type"
                         else:
                             title = "Derived Types"
-                        gen_file.write(textwrap.dedent('''
-                            {heading}
-                            {heading_mark}
-
-                        '''.format(
+                        doc.append(_SECTION_HEADING_TMPL.format(
                             heading=title,
                             heading_mark=utils.heading_mark(
                                 title,
                                 configs.SUB_SUB_SECTION_HEADING_CHAR
                             )
-                        )))
-                        gen_file.write("{0}\n".format(node.baseOrDerivedListString(
+                        ))
+                        doc.append("{0}\n".format(node.baseOrDerivedListString(
                             node.derived_compounds, self.node_by_refid
                         )))
 
@@ -2885,61 +3331,45 @@ class ExhaleRoot(object):
                     template = node.templateParametersStringAsRestList(self.node_by_refid)
                     if template:
                         heading = "Template Parameter Order"
-                        gen_file.write(textwrap.dedent('''
-                            {heading}
-                            {heading_mark}
-
-                        '''.format(
+                        doc.append(_SECTION_HEADING_TMPL.format(
                             heading=heading,
                             heading_mark=utils.heading_mark(
                                 heading,
                                 configs.SUB_SECTION_HEADING_CHAR
                             )
-                        )))
+                        ))
 
-                        gen_file.write("{template_params}\n\n".format(template_params=template))
+                        doc.append("{template_params}\n\n".format(template_params=template))
 
                         # << verboseBuild
-                        utils.verbose_log(
+                        diagnostics.append(functools.partial(
+                            utils.verbose_log,
                             "+++ {kind} {name} has usable template parameters:\n{params}".format(
                                 kind=node.kind,
                                 name=node.name,
                                 params=utils.prefix("    ", template)
                             ),
                             utils.AnsiColors.BOLD_CYAN
-                        )
+                        ))
 
                 ########################################################################
                 # The Breathe directive!!!                                             #
                 ########################################################################
-                heading = "{kind} Documentation".format(kind=utils.qualifyKind(node.kind))
-                gen_file.write(textwrap.dedent('''
-                    {heading}
-                    {heading_mark}
-
-                '''.format(
-                    heading=heading,
-                    heading_mark=utils.heading_mark(
-                        heading,
-                        configs.SUB_SECTION_HEADING_CHAR
-                    )
-                )))
+                heading, directive, specifications = self.leafKindSections(node.kind)
+                doc.append(heading)
                 # inject the appropriate doxygen directive and name of this node
-                directive = ".. {directive}:: {breathe_identifier}".format(
-                    directive=utils.kindAsBreatheDirective(node.kind),
+                doc.append("\n.. {directive}:: {breathe_identifier}\n".format(
+                    directive=directive,
                     breathe_identifier=node.breathe_identifier()
-                )
-                gen_file.write("\n{directive}\n".format(directive=directive))
+                ))
                 # include any specific directives for this doxygen directive
-                specifications = utils.prefix(
-                    "   ",
-                    "\n".join(spec for spec in utils.specificationsForKind(node.kind))
-                )
-                gen_file.write(specifications)
+                doc.append(specifications)
+                gen_file.write("".join(doc))
         except:
             utils.fancyError(
                 "Critical error while generating the file for [{0}].".format(node.file_name)
             )
+        return diagnostics
 
     def generatePageDocuments(self):
         '''
@@ -2972,19 +3402,13 @@ class ExhaleRoot(object):
                 if configs.pageLevelConfigMeta:
                     gen_file.write("{0}\n\n".format(configs.pageLevelConfigMeta))
 
-                gen_file.write(textwrap.dedent('''\
-                    {link}
-
-                    {heading}
-                    {heading_mark}
-
-                '''.format(
+                gen_file.write(_PAGE_HEADER_TMPL.format(
                     link=link_declaration,
                     heading=node.title,
                     heading_mark=utils.heading_mark(
                         node.title, configs.SECTION_HEADING_CHAR
                     )
-                )))
+                ))
 
                 contents = utils.contentsDirectiveOrNone(node.kind)
                 if contents:
@@ -3023,7 +3447,7 @@ class ExhaleRoot(object):
             for child in n.children:
                 child.findNestedNamespaces(nested_namespaces)
             # generate the children first
-            for nested in reversed(sorted(nested_namespaces)):
+            for nested in sorted(nested_namespaces, reverse=True):
                 self.generateSingleNamespace(nested)
             # generate this top level namespace
             self.generateSingleNamespace(n)
@@ -3039,40 +3463,36 @@ class ExhaleRoot(object):
         '''
         try:
             with codecs.open(nspace.file_name, "w", "utf-8") as gen_file:
+                # the document is assembled in memory and written out in one call
+                doc = []
                 # Add the metadata if they requested it
                 if configs.pageLevelConfigMeta:
-                    gen_file.write("{0}\n\n".format(configs.pageLevelConfigMeta))
+                    doc.append("{0}\n\n".format(configs.pageLevelConfigMeta))
 
                 nspace.title = "{0} {1}".format(utils.qualifyKind(nspace.kind), nspace.name)
 
                 # generate a link label for every generated file
-                gen_file.write(textwrap.dedent('''
-                    .. _{link}:
-
-                    {heading}
-                    {heading_mark}
-
-                '''.format(
+                doc.append(_NAMESPACE_HEADER_TMPL.format(
                     link=nspace.link_name,
                     heading=nspace.title,
                     heading_mark=utils.heading_mark(nspace.title, configs.SECTION_HEADING_CHAR)
-                )))
+                ))
 
                 brief, detailed = parse.getBriefAndDetailedRST(self, nspace)
                 if brief:
-                    gen_file.write("{0}\n\n".format(brief))
+                    doc.append("{0}\n\n".format(brief))
 
                 # include the contents directive if requested
                 contents = utils.contentsDirectiveOrNone(nspace.kind)
                 if contents:
-                    gen_file.write("{0}\n\n".format(contents))
+                    doc.append("{0}\n\n".format(contents))
 
                 if detailed:
-                    gen_file.write("{0}\n\n".format(detailed))
+                    doc.append("{0}\n\n".format(detailed))
 
                 # generate the headings and links for the children
-                children_string = self.generateNamespaceChildrenString(nspace)
-                gen_file.write(children_string)
+                doc.append(self.generateNamespaceChildrenString(nspace))
+                gen_file.write("".join(doc))
         except:
             utils.fancyError(
                 "Critical error while generating the file for [{0}]".format(nspace.file_name)
@@ -3101,47 +3521,45 @@ class ExhaleRoot(object):
         nsp_typedefs          = []
         nsp_unions            = []
         nsp_variables         = []
+        nsp_nested_buckets    = {
+            "class": nsp_nested_class_like,
+            "struct": nsp_nested_class_like,
+            "enum": nsp_enums,
+            "union": nsp_unions
+        }
+        nsp_buckets           = {
+            "namespace": nsp_namespaces,
+            "enum": nsp_enums,
+            "function": nsp_functions,
+            "typedef": nsp_typedefs,
+            "union": nsp_unions,
+            "variable": nsp_variables
+        }
+        listing_exclude = configs._compiled_listing_exclude
         for child in nspace.children:
             # Skip children whose names were requested to be explicitly ignored.
-            should_exclude = False
-            for exclude in configs._compiled_listing_exclude:
-                if exclude.match(child.name):
-                    should_exclude = True
-            if should_exclude:
+            if listing_exclude and any(exclude.match(child.name) for exclude in listing_exclude):
                 continue
 
-            if child.kind == "namespace":
-                nsp_namespaces.append(child)
-            elif child.kind == "struct" or child.kind == "class":
-                child.findNestedClassLike(nsp_nested_class_like)
-                child.findNestedEnums(nsp_enums)
-                child.findNestedUnions(nsp_unions)
-            elif child.kind == "enum":
-                nsp_enums.append(child)
-            elif child.kind == "function":
-                nsp_functions.append(child)
-            elif child.kind == "typedef":
-                nsp_typedefs.append(child)
-            elif child.kind == "union":
-                nsp_unions.append(child)
-            elif child.kind == "variable":
-                nsp_variables.append(child)
+            if child.kind in _CLASS_OR_STRUCT:
+                child.findNestedByKind(nsp_nested_buckets)
+            else:
+                bucket = nsp_buckets.get(child.kind)
+                if bucket is not None:
+                    bucket.append(child)
 
         # generate their headings if they exist (no Defines...that's not a C++ thing...)
-        children_stream = StringIO()
-        self.generateSortedChildListString(children_stream, "Namespaces", nsp_namespaces)
-        self.generateSortedChildListString(children_stream, "Classes", nsp_nested_class_like)
-        self.generateSortedChildListString(children_stream, "Enums", nsp_enums)
-        self.generateSortedChildListString(children_stream, "Functions", nsp_functions)
-        self.generateSortedChildListString(children_stream, "Typedefs", nsp_typedefs)
-        self.generateSortedChildListString(children_stream, "Unions", nsp_unions)
-        self.generateSortedChildListString(children_stream, "Variables", nsp_variables)
-        # read out the buffer contents, close it and return the desired string
-        children_string = children_stream.getvalue()
-        children_stream.close()
-        return children_string
-
-    def generateSortedChildListString(self, stream, sectionTitle, lst):
+        children_parts = []
+        self.generateSortedChildListString(children_parts, "Namespaces", nsp_namespaces)
+        self.generateSortedChildListString(children_parts, "Classes", nsp_nested_class_like)
+        self.generateSortedChildListString(children_parts, "Enums", nsp_enums)
+        self.generateSortedChildListString(children_parts, "Functions", nsp_functions)
+        self.generateSortedChildListString(children_parts, "Typedefs", nsp_typedefs)
+        self.generateSortedChildListString(children_parts, "Unions", nsp_unions)
+        self.generateSortedChildListString(children_parts, "Variables", nsp_variables)
+        return "".join(children_parts)
+
+    def generateSortedChildListString(self, parts, sectionTitle, lst):
         '''
         Helper method for :func:`~exhale.graph.ExhaleRoot.generateNamespaceChildrenString`.
         Used to build up a continuous string with all of the children separated out into
@@ -3149,11 +3567,11 @@ class ExhaleRoot(object):
 
         This generates a new titled section with ``sectionTitle`` and puts a link to
         every node found in ``lst`` in this section.  The newly created section is
-        appended to the existing ``stream`` buffer.
+        appended to ``parts``, the caller joins them.
 
         :Parameters:
-            ``stream`` (StringIO)
-                The already-open StringIO to write the result to.
+            ``parts`` (list)
+                The list of strings the section is to be appended to.
 
             ``sectionTitle`` (str)
                 The title of the section for this list of children.
@@ -3163,23 +3581,15 @@ class ExhaleRoot(object):
                 This method sorts ``lst`` in place.
         '''
         if lst:
-            lst.sort()
-            stream.write(textwrap.dedent('''
-
-                {heading}
-                {heading_mark}
-
-            '''.format(
+            lst.sort(key=_BY_SORT_KEY)
+            parts.append(_SORTED_CHILD_SECTION_TMPL.format(
                 heading=sectionTitle,
                 heading_mark=utils.heading_mark(
                     sectionTitle,
                     configs.SUB_SECTION_HEADING_CHAR
                 )
-            )))
-            for l in lst:
-                stream.write(textwrap.dedent('''
-                    - :ref:`{link}`
-                '''.format(link=l.link_name)))
+            ))
+            parts.extend(_LINK_ITEM_TMPL.format(link=l.link_name) for l in lst)
 
     def generateFileNodeDocuments(self):
         '''
@@ -3200,20 +3610,13 @@ class ExhaleRoot(object):
             if len(f.program_listing) > 0:
                 include_program_listing = True
                 lexer = utils.doxygenLanguageToPygmentsLexer(f.location, f.language)
-                full_program_listing = '.. code-block:: {0}\n\n'.format(lexer)
+                listing_parts = ['.. code-block:: {0}\n\n'.format(lexer)]
 
-                # need to reformat each line to remove xml tags / put <>& back in
+                # the lines are already plain source (see fileRefDiscovery), only indent
                 for pgf_line in f.program_listing:
-                    fixed_whitespace = re.sub(r'<sp/>', ' ', pgf_line)
-                    # for our purposes, this is good enough:
-                    #     http://stackoverflow.com/a/4869782/3814202
-                    no_xml_tags  = re.sub(r'<[^<]+?>', '', fixed_whitespace)
-                    revive_lt    = re.sub(r'&lt;', '<', no_xml_tags)
-                    revive_gt    = re.sub(r'&gt;', '>', revive_lt)
-                    revive_quote = re.sub(r'&quot;', '"', revive_gt)
-                    revive_apos  = re.sub(r'&apos;', "'", revive_quote)
-                    revive_amp   = re.sub(r'&amp;', '&', revive_apos)
-                    full_program_listing = "{}   {}".format(full_program_listing, revive_amp)
+                    listing_parts.append("   ")
+                    listing_parts.append(pgf_line)
+                full_program_listing = "".join(listing_parts)
 
                 # create the programlisting file
                 try:
@@ -3226,17 +3629,8 @@ class ExhaleRoot(object):
                         link_declaration = ".. _{}:".format(f.program_link_name)
                         # every generated file must have a header for sphinx to be happy
                         prog_title = "Program Listing for {} {}".format(utils.qualifyKind(f.kind), f.name)
-                        gen_file.write(textwrap.dedent('''
-                            {link}
-
-                            {heading}
-                            {heading_mark}
-
-                            |exhale_lsh| :ref:`Return to documentation for file <{file}>` (``{location}``)
-
-                            .. |exhale_lsh| unicode:: U+021B0 .. UPWARDS ARROW WITH TIP LEFTWARDS
-
-                        '''.format(  # NOTE: newline required at end (#171)
+                        # NOTE: newline required at end (#171)
+                        gen_file.write(_PROGRAM_LISTING_HEADER_TMPL.format(
                             link=link_declaration,
                             heading=prog_title,
                             heading_mark=utils.heading_mark(
@@ -3245,7 +3639,7 @@ class ExhaleRoot(object):
                             ),
                             file=f.link_name,
                             location=f.location
-                        )))
+                        ))
                         gen_file.write(full_program_listing)
                 except:
                     utils.fancyError(
@@ -3254,60 +3648,58 @@ class ExhaleRoot(object):
             else:
                 include_program_listing = False
 
+        # keys: an include string, values: the first file node whose location contains
+        # it (or None)
+        local_file_by_include = {}
         for f in self.files:
             if len(f.location) > 0:
                 heading = "Definition (``{where}``)".format(where=f.location)
-                file_definition = textwrap.dedent('''
-                    {heading}
-                    {heading_mark}
-
-                '''.format(
+                file_definition = _SECTION_HEADING_TMPL.format(
                     heading=heading,
                     heading_mark=utils.heading_mark(
                         heading,
                         configs.SUB_SECTION_HEADING_CHAR
                     )
-                ))
+                )
             else:
                 file_definition = ""
 
             if include_program_listing and file_definition != "":
-                prog_file_definition = textwrap.dedent('''
-                    .. toctree::
-                       :maxdepth: 1
-
-                       {prog_link}
-                '''.format(prog_link=os.path.basename(f.program_file)))
+                prog_file_definition = _PROGRAM_LISTING_TOCTREE_TMPL.format(
+                    prog_link=os.path.basename(f.program_file)
+                )
                 file_definition = "{}{}".format(file_definition, prog_file_definition)
 
             if len(f.includes) > 0:
                 file_includes_stream = StringIO()
                 heading = "Includes"
-                file_includes_stream.write(textwrap.dedent('''
-                    {heading}
-                    {heading_mark}
-
-                '''.format(
+                file_includes_stream.write(_SECTION_HEADING_TMPL.format(
                     heading=heading,
                     heading_mark=utils.heading_mark(
                         heading,
                         configs.SUB_SECTION_HEADING_CHAR
                     )
-                )))
-                for incl in sorted(f.includes):
-                    local_file = None
-                    for incl_file in self.files:
-                        if incl in incl_file.location:
-                            local_file = incl_file
-                            break
+                ))
+                # sorted in place rather than copied, later passes find it in order
+                f.includes.sort()
+                for incl in f.includes:
+                    # the same headers are included by many files, only search once
+                    if incl in local_file_by_include:
+                        local_file = local_file_by_include[incl]
+                    else:
+                        local_file = None
+                        for incl_file in self.files:
+                            if incl in incl_file.location:
+                                local_file = incl_file
+                                break
+                        local_file_by_include[incl] = local_file
                     if local_file is not None:
-                        file_includes_stream.write(textwrap.dedent('''
-                            - ``{include}`` (:ref:`{link}`)
-                        '''.format(include=incl, link=local_file.link_name)))
+                        file_includes_stream.write(_INCLUDE_LINK_ITEM_TMPL.format(
+                            include=incl,
+                            link=local_file.link_name
+                        ))
                     else:
-                        file_includes_stream.write(textwrap.dedent('''
-                            - ``{include}``
-                        '''.format(include=incl)))
+                        file_includes_stream.write(_INCLUDE_ITEM_TMPL.format(include=incl))
 
                 file_includes = file_includes_stream.getvalue()
                 file_includes_stream.close()
@@ -3317,24 +3709,17 @@ class ExhaleRoot(object):
             if len(f.included_by) > 0:
                 file_included_by_stream = StringIO()
                 heading = "Included By"
-                file_included_by_stream.write(textwrap.dedent('''
-                    {heading}
-                    {heading_mark}
-
-                '''.format(
+                file_included_by_stream.write(_SECTION_HEADING_TMPL.format(
                     heading=heading,
                     heading_mark=utils.heading_mark(
                         heading,
                         configs.SUB_SECTION_HEADING_CHAR
                     )
-                )))
+                ))
                 for incl_ref, incl_name in f.included_by:
-                    for incl_file in self.files:
-                        if incl_ref == incl_file.refid:
-                            file_included_by_stream.write(textwrap.dedent('''
-                                - :ref:`{link}`
-                            '''.format(link=incl_file.link_name)))
-                            break
+                    incl_file = self.node_by_refid.get(incl_ref)
+                    if incl_file is not None and incl_file.kind == "file":
+                        file_included_by_stream.write(_LINK_ITEM_TMPL.format(link=incl_file.link_name))
                 file_included_by = file_included_by_stream.getvalue()
                 file_included_by_stream.close()
             else:
@@ -3349,37 +3734,66 @@ class ExhaleRoot(object):
             file_unions     = []
             file_variables  = []
             file_defines    = []
+            file_buckets    = {
+                "struct": file_structs,
+                "class": file_classes,
+                "enum": file_enums,
+                "function": file_functions,
+                "typedef": file_typedefs,
+                "union": file_unions,
+                "variable": file_variables,
+                "define": file_defines
+            }
             for child in f.children:
-                if child.kind == "struct":
-                    file_structs.append(child)
-                elif child.kind == "class":
-                    file_classes.append(child)
-                elif child.kind == "enum":
-                    file_enums.append(child)
-                elif child.kind == "function":
-                    file_functions.append(child)
-                elif child.kind == "typedef":
-                    file_typedefs.append(child)
-                elif child.kind == "union":
-                    file_unions.append(child)
-                elif child.kind == "variable":
-                    file_variables.append(child)
-                elif child.kind == "define":
-                    file_defines.append(child)
+                bucket = file_buckets.get(child.kind)
+                if bucket is not None:
+                    bucket.append(child)
 
             # generate the listing of children referenced to from this file
-            children_stream = StringIO()
-            self.generateSortedChildListString(children_stream, "Namespaces", f.namespaces_used)
-            self.generateSortedChildListString(children_stream, "Classes", file_structs + file_classes)
-            self.generateSortedChildListString(children_stream, "Enums", file_enums)
-            self.generateSortedChildListString(children_stream, "Functions", file_functions)
-            self.generateSortedChildListString(children_stream, "Defines", file_defines)
-            self.generateSortedChildListString(children_stream, "Typedefs", file_typedefs)
-            self.generateSortedChildListString(children_stream, "Unions", file_unions)
-            self.generateSortedChildListString(children_stream, "Variables", file_variables)
-
-            children_string = children_stream.getvalue()
-            children_stream.close()
+            children_parts = []
+            self.generateSortedChildListString(children_parts, "Namespaces", f.namespaces_used)
+            self.generateSortedChildListString(children_parts, "Classes", file_structs + file_classes)
+            self.generateSortedChildListString(children_parts, "Enums", file_enums)
+            self.generateSortedChildListString(children_parts, "Functions", file_functions)
+            self.generateSortedChildListString(children_parts, "Defines", file_defines)
+            self.generateSortedChildListString(children_parts, "Typedefs", file_typedefs)
+            self.generateSortedChildListString(children_parts, "Unions", file_unions)
+            self.generateSortedChildListString(children_parts, "Variables", file_variables)
+
+            children_string = "".join(children_parts)
+
+            # the Full File Listing goes at the end of the same document
+            if configs.generateBreatheFileDirectives:
+                try:
+                    heading        = "Full File Listing"
+                    heading_mark   = utils.heading_mark(
+                        heading, configs.SUB_SECTION_HEADING_CHAR
+                    )
+                    directive      = utils.kindAsBreatheDirective(f.kind)
+                    node           = f.location
+                    specifications = "\n   ".join(
+                        spec for spec in utils.specificationsForKind(f.kind)
+                    )
+
+                    file_directive = textwrap.dedent('''
+                        {heading}
+                        {heading_mark}
+
+                        .. {directive}:: {node}
+                           {specifications}
+                    '''.format(
+                        heading=heading,
+                        heading_mark=heading_mark,
+                        directive=directive,
+                        node=node,
+                        specifications=specifications
+                    ))
+                except:
+                    utils.fancyError(
+                        "Critical error while generating the breathe directive for [{0}]".format(f.file_name)
+                    )
+            else:
+                file_directive = ""
 
             try:
                 with codecs.open(f.file_name, "w", "utf-8") as gen_file:
@@ -3391,29 +3805,19 @@ class ExhaleRoot(object):
                     link_declaration = ".. _{0}:".format(f.link_name)
                     # every generated file must have a header for sphinx to be happy
                     f.title = "{0} {1}".format(utils.qualifyKind(f.kind), f.name)
-                    gen_file.write(textwrap.dedent('''
-                        {link}
-
-                        {heading}
-                        {heading_mark}
-                    '''.format(
+                    gen_file.write(_FILE_HEADER_TMPL.format(
                         link=link_declaration,
                         heading=f.title,
                         heading_mark=utils.heading_mark(
                             f.title,
                             configs.SECTION_HEADING_CHAR
                         )
-                    )))
+                    ))
 
                     if f.parent and f.parent.kind == "dir":
-                        gen_file.write(textwrap.dedent('''
-                            |exhale_lsh| :ref:`Parent directory <{parent_link}>` (``{parent_name}``)
-
-                            .. |exhale_lsh| unicode:: U+021B0 .. UPWARDS ARROW WITH TIP LEFTWARDS
-
-                        '''.format(  # NOTE: newline required at end (#171)
+                        gen_file.write(_PARENT_DIRECTORY_TMPL.format(  # NOTE: newline required at end (#171)
                             parent_link=f.parent.link_name, parent_name=f.parent.name
-                        )))
+                        ))
 
                     brief, detailed = parse.getBriefAndDetailedRST(self, f)
                     if brief:
@@ -3441,42 +3845,13 @@ class ExhaleRoot(object):
                         includeby=file_included_by,
                         children=children_string
                     )).lstrip())
+                    if file_directive:
+                        gen_file.write(file_directive)
             except:
                 utils.fancyError(
                     "Critical error while generating the file for [{0}]".format(f.file_name)
                 )
 
-            if configs.generateBreatheFileDirectives:
-                try:
-                    with codecs.open(f.file_name, "a", "utf-8") as gen_file:
-                        heading        = "Full File Listing"
-                        heading_mark   = utils.heading_mark(
-                            heading, configs.SUB_SECTION_HEADING_CHAR
-                        )
-                        directive      = utils.kindAsBreatheDirective(f.kind)
-                        node           = f.location
-                        specifications = "\n   ".join(
-                            spec for spec in utils.specificationsForKind(f.kind)
-                        )
-
-                        gen_file.write(textwrap.dedent('''
-                            {heading}
-                            {heading_mark}
-
-                            .. {directive}:: {node}
-                               {specifications}
-                        '''.format(
-                            heading=heading,
-                            heading_mark=heading_mark,
-                            directive=directive,
-                            node=node,
-                            specifications=specifications
-                        )))
-                except:
-                    utils.fancyError(
-                        "Critical error while generating the breathe directive for [{0}]".format(f.file_name)
-                    )
-
     def generateDirectoryNodeDocuments(self):
         '''
         Generates all of the directory reStructuredText documents.
@@ -3499,29 +3874,20 @@ class ExhaleRoot(object):
                 The directory node to generate the reStructuredText document for.
         '''
         # find the relevant children: directories and files only
-        child_dirs  = []
-        child_files = []
-        for c in node.children:
-            if c.kind == "dir":
-                child_dirs.append(c)
-            elif c.kind == "file":
-                child_files.append(c)
+        child_dirs  = [c for c in node.children if c.kind == "dir"]
+        child_files = [c for c in node.children if c.kind == "file"]
 
         # generate the subdirectory section
         if len(child_dirs) > 0:
             heading = "Subdirectories"
-            child_dirs_string = textwrap.dedent('''
-                {heading}
-                {heading_mark}
-
-            '''.format(
+            child_dirs_string = _SECTION_HEADING_TMPL.format(
                 heading=heading,
                 heading_mark=utils.heading_mark(
                     heading,
                     configs.SUB_SECTION_HEADING_CHAR
                 )
-            ))
-            for child_dir in sorted(child_dirs):
+            )
+            for child_dir in sorted(child_dirs, key=_BY_SORT_KEY):
                 child_dirs_string = "{}- :ref:`{}`\n".format(child_dirs_string, child_dir.link_name)
         else:
             child_dirs_string = ""
@@ -3529,31 +3895,22 @@ class ExhaleRoot(object):
         # generate the files section
         if len(child_files) > 0:
             heading = "Files"
-            child_files_string = textwrap.dedent('''
-                {heading}
-                {heading_mark}
-
-            '''.format(
+            child_files_string = _SECTION_HEADING_TMPL.format(
                 heading=heading,
                 heading_mark=utils.heading_mark(
                     heading,
                     configs.SUB_SECTION_HEADING_CHAR
                 )
-            ))
-            for child_file in sorted(child_files):
+            )
+            for child_file in sorted(child_files, key=_BY_SORT_KEY):
                 child_files_string = "{}- :ref:`{}`\n".format(child_files_string, child_file.link_name)
         else:
             child_files_string = ""
 
         if node.parent and node.parent.kind == "dir":
-            parent_directory = textwrap.dedent('''
-                |exhale_lsh| :ref:`Parent directory <{parent_link}>` (``{parent_name}``)
-
-                .. |exhale_lsh| unicode:: U+021B0 .. UPWARDS ARROW WITH TIP LEFTWARDS
-
-            '''.format(  # NOTE: newline required at end (#171)
+            parent_directory = _PARENT_DIRECTORY_TMPL.format(  # NOTE: newline required at end (#171)
                 parent_link=node.parent.link_name, parent_name=node.parent.name
-            ))
+            )
         else:
             parent_directory = ""
 
@@ -3567,22 +3924,18 @@ class ExhaleRoot(object):
 
                 # generate a link label for every generated file
                 link_declaration = ".. _{0}:\n\n".format(node.link_name)
-                header = textwrap.dedent('''
-                    {heading}
-                    {heading_mark}
-
-                '''.format(
+                header = _SECTION_HEADING_TMPL.format(
                     heading=node.title,
                     heading_mark=utils.heading_mark(
                         node.title,
                         configs.SECTION_HEADING_CHAR
                     )
-                ))
+                )
                 path = "\n*Directory path:* ``{path}``\n".format(path=node.name)
                 # write it all out
                 gen_file.write("{0}{1}{2}{3}{4}\n{5}\n\n".format(
-                    link_declaration, header, parent_directory, path, child_dirs_string, child_files_string)
-                )
+                    link_declaration, header, parent_directory, path, child_dirs_string, child_files_string
+                ))
         except:
             utils.fancyError(
                 "Critical error while generating the file for [{0}]".format(node.file_name)
@@ -3835,28 +4188,29 @@ class ExhaleRoot(object):
             if data:
                 # conveniently, both get indented to the same level.  a happy accident
                 indent = " " * 9  # indent by 6 + 3 for being under .. raw:: html
-                indented_data = re.sub(r'(.+)', r'{indent}\1'.format(indent=indent), data)
+                # indent every non-empty line, plain string operations rather than a regex
+                indented_data = "\n".join(
+                    indent + line if line else line for line in data.split("\n")
+                )
                 idx = hierarchy_config["idx"]
 
-                final_data_stream = StringIO()
                 if configs.treeViewIsBootstrap:
                     func_name = hierarchy_config["bstrap_data_func_name"]
                     # developer note: when using string formatting with {curly_braces}, if
                     # you want a literal curly brace you escape it with curly braces.  so
                     # the left curly brace is `{{` rather than `{` so that the formatting
                     # knows you want a literal `{` in the end.
-                    final_data_stream.write(textwrap.dedent('''
+                    final_data_parts = [textwrap.dedent('''
                         .. raw:: html
 
                            <div id="{idx}"></div>
                            <script type="text/javascript">
                              function {func_name}() {{
                                 return [
-                    '''.format(idx=idx, func_name=func_name)))
-                    final_data_stream.write(indented_data)
+                    '''.format(idx=idx, func_name=func_name)), indented_data]
                     # NOTE: the final .. end raw html line "tricks" textwrap.dedent into
                     #       only stripping out until there. DO NOT REMOVE EVER!
-                    final_data_stream.write(textwrap.dedent('''
+                    final_data_parts.append(textwrap.dedent('''
                                 ]
                              }}
                            </script><!-- end {func_name}() function -->
@@ -3864,17 +4218,16 @@ class ExhaleRoot(object):
                         .. end raw html for treeView
                     '''.format(idx=idx, func_name=func_name)))
                 else:
-                    final_data_stream.write(textwrap.dedent('''
+                    final_data_parts = [textwrap.dedent('''
                         .. raw:: html
 
                            <ul class="treeView" id="{idx}">
                              <li>
                                <ul class="collapsibleList">
-                    '''.format(idx=idx)))
-                    final_data_stream.write(indented_data)
+                    '''.format(idx=idx)), indented_data]
                     # NOTE: the final .. end raw html line "tricks" textwrap.dedent into
                     #       only stripping out until there. DO NOT REMOVE EVER!
-                    final_data_stream.write(textwrap.dedent('''
+                    final_data_parts.append(textwrap.dedent('''
                                </ul>
                              </li><!-- only tree view element -->
                            </ul><!-- /treeView {idx} -->
@@ -3883,8 +4236,7 @@ class ExhaleRoot(object):
                     '''.format(idx=idx)))
 
                 # the appropriate raw html has been created, grab the final value
-                final_data_string = final_data_stream.getvalue()
-                final_data_stream.close()
+                final_data_string = "".join(final_data_parts)
             else:
                 final_data_string = data
         else:
@@ -3897,21 +4249,22 @@ class ExhaleRoot(object):
         # write everything to file to be incorporated with `.. include::` later
         try:
             if final_data_string:
-                with codecs.open(file_name, "w", "utf-8") as hierarchy_file:
-                    file_title = hierarchy_config["file_title"]
-                    hierarchy_file.write(textwrap.dedent('''
-                        {heading}
-                        {heading_mark}
+                file_title = hierarchy_config["file_title"]
+                heading = textwrap.dedent('''
+                    {heading}
+                    {heading_mark}
 
-                    ''').format(
-                        heading=file_title,
-                        heading_mark=utils.heading_mark(
-                            file_title,
-                            configs.SUB_SECTION_HEADING_CHAR
-                        )
-                    ))
-                    hierarchy_file.write(final_data_string)
-                    hierarchy_file.write("\n\n")  # just in case, extra whitespace causes no harm
+                ''').format(
+                    heading=file_title,
+                    heading_mark=utils.heading_mark(
+                        file_title,
+                        configs.SUB_SECTION_HEADING_CHAR
+                    )
+                )
+                # one write for the whole document, extra trailing whitespace causes no harm.
+                # encoded up front, the same bytes codecs.open would write
+                with open(file_name, "wb") as hierarchy_file:
+                    hierarchy_file.write(f"{heading}{final_data_string}\n\n".encode("utf-8"))
         except:
             h_type = hierarchy_config["type"]
             utils.fancyError("Error writing the {h_type} hierarchy.".format(h_type=h_type))
@@ -3920,100 +4273,75 @@ class ExhaleRoot(object):
         '''
         Generates the pages view hierarchy, writing it to ``self.page_hierarchy_file``.
         '''
-        page_view_stream = StringIO()
+        page_view_parts = []
 
         for p in self.pages:
-            p.toHierarchy("page", 0, page_view_stream)
+            p.toHierarchy("page", 0, page_view_parts)
 
-        # extract the value from the stream and close it down
-        page_view_string = page_view_stream.getvalue()
-        page_view_stream.close()
-
-        return page_view_string
+        return "".join(page_view_parts)
 
     def generateClassView(self):
         '''
         Generates the class view hierarchy, writing it to ``self.class_hierarchy_file``.
         '''
-        class_view_stream = StringIO()
+        class_view_parts = []
 
+        # where the output of the last namespace begins, see the restart below
+        last_nspace_start = 0
         for n in self.namespaces:
-            n.toHierarchy("class", 0, class_view_stream)
-
-        # Add everything that was not nested in a namespace.
-        missing = []
-        # class-like objects (structs and classes)
-        for cl in sorted(self.class_like):
-            if not cl.in_class_hierarchy:
-                missing.append(cl)
-        # enums
-        for e in sorted(self.enums):
-            if not e.in_class_hierarchy:
-                missing.append(e)
-        # unions
-        for u in sorted(self.unions):
-            if not u.in_class_hierarchy:
-                missing.append(u)
-
-        if len(missing) > 0:
-            idx = 0
+            last_nspace_start = len(class_view_parts)
+            n.toHierarchy("class", 0, class_view_parts)
+
+        # Add everything that was not nested in a namespace.  The lists are already
+        # sorted by sortInternals, only filter them.
+        missing = [
+            node
+            # class-like objects (structs and classes), enums, and unions
+            for node in itertools.chain(self.class_like, self.enums, self.unions)
+            if not node.in_class_hierarchy
+        ]
+
+        if missing:
             last_missing_child = len(missing) - 1
-            for m in missing:
-                m.toHierarchy("class", 0, class_view_stream, idx == last_missing_child)
-                idx += 1
-        elif configs.createTreeView:
+            for idx, m in enumerate(missing):
+                m.toHierarchy("class", 0, class_view_parts, idx == last_missing_child)
+        elif configs.createTreeView and self.namespaces:
             # need to restart since there were no missing children found, otherwise the
-            # last namespace will not correctly have a lastChild
-            class_view_stream.close()
-            class_view_stream = StringIO()
-
-            last_nspace_index = len(self.namespaces) - 1
-            for idx in range(last_nspace_index + 1):
-                nspace = self.namespaces[idx]
-                nspace.toHierarchy("class", 0, class_view_stream, idx == last_nspace_index)
+            # last namespace will not correctly have a lastChild.  Only the output of
+            # the last namespace changes, so only it is generated again.
+            del class_view_parts[last_nspace_start:]
+            self.namespaces[-1].toHierarchy("class", 0, class_view_parts, True)
 
-        # extract the value from the stream and close it down
-        class_view_string = class_view_stream.getvalue()
-        class_view_stream.close()
-        return class_view_string
+        return "".join(class_view_parts)
 
     def generateDirectoryView(self):
         '''
         Generates the file view hierarchy, writing it to ``self.file_hierarchy_file``.
         '''
-        file_view_stream = StringIO()
+        file_view_parts = []
 
+        # where the output of the last directory begins, see the restart below
+        last_dir_start = 0
         for d in self.dirs:
-            d.toHierarchy("file", 0, file_view_stream)
+            last_dir_start = len(file_view_parts)
+            d.toHierarchy("file", 0, file_view_parts)
 
         # add potential missing files (not sure if this is possible though)
-        missing = []
-        for f in sorted(self.files):
-            if not f.in_file_hierarchy:
-                missing.append(f)
-
-        found_missing = len(missing) > 0
-        if found_missing:
-            idx = 0
+        # self.files is already sorted by sortInternals
+        missing = [f for f in self.files if not f.in_file_hierarchy]
+
+        if missing:
             last_missing_child = len(missing) - 1
-            for m in missing:
-                m.toHierarchy("file", 0, file_view_stream, idx == last_missing_child)
-                idx += 1
-        elif configs.createTreeView:
+            for idx, m in enumerate(missing):
+                m.toHierarchy("file", 0, file_view_parts, idx == last_missing_child)
+        elif configs.createTreeView and self.dirs:
             # need to restart since there were no missing children found, otherwise the
-            # last directory will not correctly have a lastChild
-            file_view_stream.close()
-            file_view_stream = StringIO()
-
-            last_dir_index = len(self.dirs) - 1
-            for idx in range(last_dir_index + 1):
-                curr_d = self.dirs[idx]
-                curr_d.toHierarchy("file", 0, file_view_stream, idx == last_dir_index)
+            # last directory will not correctly have a lastChild.  Only the output of
+            # the last directory changes, so only it is generated again.
+            del file_view_parts[last_dir_start:]
+            self.dirs[-1].toHierarchy("file", 0, file_view_parts, True)
 
-        # extract the value from the stream and close it down
-        file_view_string = file_view_stream.getvalue()
-        file_view_stream.close()
-        return file_view_string
+        return "".join(file_view_parts)
 
     def generateUnabridgedAPI(self):
         '''
@@ -4091,13 +4419,13 @@ class ExhaleRoot(object):
                     continue
                 unabridged_specs[node.kind].append(node)
 
-            # Create the buffers to write to and dump the page headings.
-            unabridged_api = StringIO()
-            orphan_api = StringIO()
+            # Create the lists of strings to write and add the page headings.
+            unabridged_api = []
+            orphan_api = []
             for page, is_orphan in [(unabridged_api, False), (orphan_api, True)]:
                 if is_orphan:
-                    page.write(":orphan:\n\n")
-                page.write(textwrap.dedent('''
+                    page.append(":orphan:\n\n")
+                page.append(textwrap.dedent('''
                     {heading}
                     {heading_mark}
                 '''.format(
@@ -4135,25 +4463,25 @@ class ExhaleRoot(object):
                 self.enumerateAll(title, node_list, dest)
 
             # Write out the unabridged api file (gets included to root).
-            with codecs.open(self.unabridged_api_file, "w", "utf-8") as full_api_file:
-                full_api_file.write(unabridged_api.getvalue())
+            with open(self.unabridged_api_file, "wb") as full_api_file:
+                full_api_file.write("".join(unabridged_api).encode("utf-8"))
 
             # If the orphan file has any .. toctree:: in there, then we want to make
             # sure to write it.  For example, if files and directories are dumped here,
             # we want Sphinx to be convinced that they show up in a toctree somewhere.
-            orphan_api_value = orphan_api.getvalue()
+            orphan_api_value = "".join(orphan_api)
             if "toctree" in orphan_api_value:
-                with codecs.open(self.unabridged_orphan_file, "w", "utf-8") as orphan_file:
-                    orphan_file.write(orphan_api_value)
+                with open(self.unabridged_orphan_file, "wb") as orphan_file:
+                    orphan_file.write(orphan_api_value.encode("utf-8"))
         except:
             utils.fancyError("Error writing the unabridged API.")
 
-    def enumerateAll(self, subsectionTitle, lst, openFile):
+    def enumerateAll(self, subsectionTitle, lst, parts):
         '''
         Helper function for :func:`~exhale.graph.ExhaleRoot.generateUnabridgedAPI`.
-        Simply writes a subsection to ``openFile`` (a ``toctree`` to the ``file_name``)
-        of each ExhaleNode in ``sorted(lst)`` if ``len(lst) > 0``.  Otherwise, nothing
-        is written to the file.
+        Simply appends a subsection to ``parts`` (a ``toctree`` to the ``file_name``)
+        of each ExhaleNode in ``sorted(lst)`` if ``lst`` is not empty.  Otherwise, nothing
+        is appended.
 
         :Parameters:
             ``subsectionTitle`` (str)
@@ -4162,33 +4490,21 @@ class ExhaleRoot(object):
             ``lst`` (list)
                 The list of ExhaleNodes to be enumerated in this subsection.
 
-            ``openFile`` (File)
-                The **already open** file object to write to directly.  No safety checks
-                are performed, make sure this is a real file object that has not been
-                closed already.
+            ``parts`` (list)
+                The list of strings the subsection is appended to.  The caller writes
+                the joined document once all subsections have been added.
         '''
-        if len(lst) > 0:
-            openFile.write(textwrap.dedent('''
-                {heading}
-                {heading_mark}
-
-            '''.format(
+        if lst:
+            parts.append(_SECTION_HEADING_TMPL.format(
                 heading=subsectionTitle,
                 heading_mark=utils.heading_mark(
                     subsectionTitle,
                     configs.SUB_SUB_SECTION_HEADING_CHAR
                 )
-            )))
-            for l in sorted(lst):
-                openFile.write(textwrap.dedent('''
-                    .. toctree::
-                       :maxdepth: {depth}
-
-                       {file}
-                '''.format(
-                    depth=configs.fullToctreeMaxDepth,
-                    file=l.file_name
-                )))
+            ))
+            # everything but the file name is the same for every toctree
+            toctree = _UNABRIDGED_TOCTREE_TMPL.format(depth=configs.fullToctreeMaxDepth)
+            parts.extend(f"{toctree}{l.file_name}\n" for l in sorted(lst, key=_BY_SORT_KEY))
 
     ####################################################################################
     #
@@ -4200,113 +4516,9 @@ class ExhaleRoot(object):
     def toConsole(self):
         '''
         Convenience function for printing out the entire API being generated to the
-        console.  Unused in the release, but is helpful for debugging ;)
-        '''
-        fmt_spec = {
-            "class":     utils.AnsiColors.BOLD_MAGENTA,
-            "struct":    utils.AnsiColors.BOLD_CYAN,
-            "define":    utils.AnsiColors.BOLD_YELLOW,
-            "enum":      utils.AnsiColors.BOLD_MAGENTA,
-            "enumvalue": utils.AnsiColors.BOLD_RED,     # red means unused in framework
-            "function":  utils.AnsiColors.BOLD_CYAN,
-            "file":      utils.AnsiColors.BOLD_YELLOW,
-            "dir":       utils.AnsiColors.BOLD_MAGENTA,
-            "group":     utils.AnsiColors.BOLD_RED,     # red means unused in framework
-            "namespace": utils.AnsiColors.BOLD_CYAN,
-            "typedef":   utils.AnsiColors.BOLD_YELLOW,
-            "union":     utils.AnsiColors.BOLD_MAGENTA,
-            "variable":  utils.AnsiColors.BOLD_CYAN,
-            "page":      utils.AnsiColors.BOLD_YELLOW
-        }
-
-        self.consoleFormat(
-            "{0} and {1}".format(
-                utils._use_color("Classes", fmt_spec["class"],  sys.stderr),
-                utils._use_color("Structs", fmt_spec["struct"], sys.stderr),
-            ),
-            self.class_like,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Defines", fmt_spec["define"], sys.stderr),
-            self.defines,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Enums", fmt_spec["enum"], sys.stderr),
-            self.enums,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Enum Values (unused)", fmt_spec["enumvalue"], sys.stderr),
-            self.enum_values,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Functions", fmt_spec["function"], sys.stderr),
-            self.functions,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Files", fmt_spec["file"], sys.stderr),
-            self.files,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Directories", fmt_spec["dir"], sys.stderr),
-            self.dirs,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Groups (unused)", fmt_spec["group"], sys.stderr),
-            self.groups,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Namespaces", fmt_spec["namespace"], sys.stderr),
-            self.namespaces,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Typedefs", fmt_spec["typedef"], sys.stderr),
-            self.typedefs,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Unions", fmt_spec["union"], sys.stderr),
-            self.unions,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Variables", fmt_spec["variable"], sys.stderr),
-            self.variables,
-            fmt_spec
-        )
-        self.consoleFormat(
-            utils._use_color("Pages", fmt_spec["page"], sys.stderr),
-            self.pages,
-            fmt_spec
-        )
-
-    def consoleFormat(self, sectionTitle, lst, fmt_spec):
+        console when :data:`~exhale.configs.verboseBuild` is ``True``.  Helpful for
+        debugging, the implementation lives in ``exhale/_debug.py``.
         '''
-        Helper method for :func:`~exhale.graph.ExhaleRoot.toConsole`.  Prints the given
-        ``sectionTitle`` and calls :func:`~exhale.graph.ExhaleNode.toConsole` with ``0``
-        as the level for every ExhaleNode in ``lst``.
-
-        **Parameters**
-            ``sectionTitle`` (str)
-                The title that will be printed with some visual separators around it.
-
-            ``lst`` (list)
-                The list of ExhaleNodes to print to the console.
-        '''
-        if not configs.verboseBuild:
-            return
-
-        utils.verbose_log(textwrap.dedent('''
-            ###########################################################
-            ## {0}
-            ###########################################################'''.format(sectionTitle)))
-        for l in lst:
-            l.toConsole(0, fmt_spec)
+        if configs.verboseBuild:
+            from . import _debug
+            _debug.rootToConsole(self)
@@ -209,7 +209,7 @@ def getBriefAndDetailedRST(textRoot, node):
         return "", ""
 
     try:
-        node_soup = BeautifulSoup(node_xml_contents, "lxml-xml")
+        node_soup = BeautifulSoup(node_xml_contents, utils.XML_PARSER)
     except:
         utils.fancyError("Unable to parse [{0}] xml using BeautifulSoup".format(node.name))
 
@@ -11,9 +11,9 @@ from typing import TextIO, Union
 
 from . import configs
 
-import codecs
 from dataclasses import dataclass
 import datetime
+from functools import lru_cache
 from io import StringIO
 import os
 import re
@@ -24,6 +24,8 @@ import time
 import traceback
 import types
 
+from lxml import etree
+
 # Fancy error printing <3
 try:
     import pygments
@@ -156,6 +158,14 @@ CLASS_LIKE_KINDS = [
 ]
 """All kinds that are "class-like"."""
 
+XML_PARSER = "lxml-xml"
+"""
+The :class:`bs4.BeautifulSoup` parser used for all Doxygen XML.
+
+The ``lxml`` backend is a hard requirement of Exhale: it is considerably faster than
+the pure python parsers, and the ``html.parser`` backend cannot parse XML correctly.
+"""
+
 
 def contentsDirectiveOrNone(kind):
     '''
@@ -248,19 +258,109 @@ def makeCustomSpecificationsMapping(func):
     return ret
 
 
+def nodeCompoundXMLPath(node):
+    '''
+    Return the path to ``{refid}.xml`` for the specified node, or ``None`` if Doxygen did
+    not create one (e.g., for an enum or union).  Existence is checked against
+    :data:`~exhale.configs._doxygen_xml_files` when it has been populated.
+    '''
+    file_name = f"{node.refid}.xml"
+    node_xml_path = os.path.join(configs._doxygen_xml_output_directory, file_name)
+    if configs._doxygen_xml_files is not None:
+        exists = file_name in configs._doxygen_xml_files
+    else:
+        exists = os.path.isfile(node_xml_path)
+    return node_xml_path if exists else None
+
+
 def nodeCompoundXMLContents(node):
-    node_xml_path = os.path.join(configs._doxygen_xml_output_directory, "{0}.xml".format(node.refid))
-    if os.path.isfile(node_xml_path):
-        try:
-            with codecs.open(node_xml_path, "r", "utf-8") as xml:
-                node_xml_contents = xml.read()
+    node_xml_path = nodeCompoundXMLPath(node)
+    if not node_xml_path:
+        return None
+    try:
+        with open(node_xml_path, "r", encoding="utf-8") as xml:
+            return xml.read()
+    except (OSError, UnicodeDecodeError):
+        return None
 
-            return node_xml_contents
-        except:
-            return None
+
+def nodeCompoundLocationFile(node):
+    '''
+    Return the ``file`` attribute of the ``<location>`` of the ``<compounddef>`` for the
+    specified node, without building the document tree of the whole compound.
+
+    The compound xml is streamed with :func:`lxml.etree.iterparse`, every
+    ``<sectiondef>`` is released as soon as it has been parsed, and parsing stops as soon
+    as the ``<location>`` belonging directly to the ``<compounddef>`` is found.
+
+    **Parameters**
+        ``node`` (:class:`~exhale.graph.ExhaleNode`)
+            The node to find the declaring file of.
+
+    **Return**
+        ``str`` or ``None``
+            The (unnormalized) path Doxygen recorded, or ``None`` if ``{refid}.xml`` does
+            not exist, cannot be parsed, or has no such ``<location>``.
+    '''
+    node_xml_path = nodeCompoundXMLPath(node)
+    if not node_xml_path:
+        return None
+    try:
+        for _, elem in etree.iterparse(node_xml_path, events=("end",), tag=("sectiondef", "location")):
+            if elem.tag == "sectiondef":
+                elem.clear()
+            elif elem.getparent().tag == "compounddef":
+                return elem.get("file")
+    except (OSError, etree.XMLSyntaxError):
+        pass
     return None
 
 
+# The identifiers of a program listing, see programListingMentions.
+_IDENTIFIER_RE = re.compile(r"[^\W\d]\w*")
+
+
+def programListingTokens(listing):
+    '''
+    Return the set of identifiers appearing in the specified program listing text.
+
+    **Parameters**
+        ``listing`` (:class:`python:str`)
+            The text of a ``<programlisting>``.
+
+    **Return**
+        ``set``
+            Every whole identifier token of ``listing``, for use with
+            :func:`~exhale.utils.programListingMentions`.
+    '''
+    return set(_IDENTIFIER_RE.findall(listing))
+
+
+def programListingMentions(name, listing, listing_tokens):
+    '''
+    Return whether the unqualified ``name`` appears in a program listing.  Identifiers
+    must match a whole token (``foo`` is not found in ``foobar``), names that are not
+    identifiers such as ``operator==`` are searched for in the text of the listing.
+
+    **Parameters**
+        ``name`` (:class:`python:str`)
+            The unqualified name to search for.
+
+        ``listing`` (:class:`python:str`)
+            The text of the ``<programlisting>``.
+
+        ``listing_tokens`` (``set``)
+            The result of :func:`~exhale.utils.programListingTokens` for ``listing``.
+
+    **Return**
+        ``bool``
+            ``True`` if ``name`` was found in the listing.
+    '''
+    if name.isidentifier():
+        return name in listing_tokens
+    return name in listing
+
+
 def sanitize(name):
     """
     Sanitize the specified ``name`` for use with breathe directives.
@@ -393,6 +493,7 @@ def doxygenLanguageToPygmentsLexer(location, language):
 ##
 #
 ########################################################################################
+@lru_cache(maxsize=None)
 def qualifyKind(kind):
     '''
     Qualifies the breathe ``kind`` and returns an qualifier string describing this
@@ -452,6 +553,7 @@ def qualifyKind(kind):
         return kind.capitalize()
 
 
+@lru_cache(maxsize=None)
 def kindAsBreatheDirective(kind):
     '''
     Returns the appropriate breathe restructured text directive for the specified kind.
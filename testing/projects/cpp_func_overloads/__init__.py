@@ -2,7 +2,7 @@
 The ``cpp_func_overloads`` test project.
 """
 
-from testing.hierarchies import clike, directory, file, function, namespace, parameters
+from testing.hierarchies import clike, directory, enum, file, function, namespace, parameters
 
 
 def default_class_hierarchy_dict():
@@ -10,6 +10,7 @@ def default_class_hierarchy_dict():
     return {
         namespace("overload"): {
             clike("class", "CustomType"): {},
+            enum("Ordering"): {}
         }
     }
 
@@ -102,7 +103,8 @@ def default_file_hierarchy_dict():
                         function("bool", "operator<="): parameters(
                             "const CustomType&", "const CustomType&"),
                         function("bool", "operator>="): parameters(
-                            "const CustomType&", "const CustomType&")
+                            "const CustomType&", "const CustomType&"),
+                        enum("Ordering"): {}
                     }
                 }
             }
@@ -68,5 +68,12 @@ namespace overload {
     /// Operator >=
     bool operator>=(const CustomType &lhs, const CustomType &rhs);
 
+    /// The result of comparing two CustomType instances.
+    enum class Ordering {
+        less,   ///< The left hand side compares less.
+        equal,  ///< Both sides compare equal.
+        greater ///< The left hand side compares greater.
+    };
+
     // TODO: operator<=> when you can get proper C++20 support in CI...
 }  // namespace overload
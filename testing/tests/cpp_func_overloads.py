@@ -38,3 +38,26 @@ class CPPFuncOverloads(ExhaleTestCase):
         """Verify the class and file hierarchies."""
         compare_class_hierarchy(self, class_hierarchy(self.class_hierarchy_dict()))
         compare_file_hierarchy(self, file_hierarchy(self.file_hierarchy_dict()))
+
+    def test_namespace_members_are_unique(self):
+        """Verify members listed by both a namespace and a file get exactly one node."""
+        exhale_root = self.app.exhale_root
+        all_nodes = exhale_root.all_nodes
+        for kind, nodes in (("function", exhale_root.functions), ("enum", exhale_root.enums)):
+            refids = [node.refid for node in nodes]
+            assert len(refids) == len(set(refids)), "duplicate {0} nodes".format(kind)
+            assert len([n for n in all_nodes if n.kind == kind]) == len(nodes)
+
+        def namespaced(root):
+            # (kind, qualified name, defining file) of every namespaced function / enum
+            return sorted(
+                (node.kind, node.name, node.def_in_file.name if node.def_in_file else None)
+                for node in root.functions + root.enums
+                if node.parent is not None and node.parent.kind == "namespace"
+            )
+
+        # every blargh overload and operator, plus the Ordering enum
+        expected = namespaced(file_hierarchy(self.file_hierarchy_dict()))
+        assert len(expected) == 32
+        assert all(name.startswith("overload::") for _, name, _ in expected)
+        assert namespaced(exhale_root) == expected
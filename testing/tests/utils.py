@@ -10,7 +10,8 @@ Tests for validating parts of :mod:`exhale.utils`.
 """
 import re
 
-from exhale.utils import join_template_tokens, tokenize_template
+from exhale.utils import join_template_tokens, programListingMentions, programListingTokens, \
+    tokenize_template
 
 import pytest
 
@@ -136,3 +137,37 @@ def test_join_template_tokens_edge_cases():
     exc_info.match(re.escape(
         "The first token must be a string, but the type of tokens[0] is <class "
         "'list'>."))
+
+
+listing = """
+namespace overload {
+    /// Operator ==
+    bool operator==(const CustomType &lhs, const CustomType &rhs);
+
+    int foobar();
+    int bar_2(int foo_);
+}  // namespace overload
+"""
+"""
+A program listing to search for (potentially orphaned) names in.
+"""
+
+
+@pytest.mark.parametrize("name,expected", [
+    # Whole identifier tokens are found.
+    ("foobar", True),
+    ("bar_2", True),
+    ("overload", True),
+    # Substrings of an identifier are not.
+    ("foo", False),
+    ("bar", False),
+    ("ar_2", False),
+    # Names that are not identifiers are searched for in the text.
+    ("operator==", True),
+    ("operator!=", False),
+])
+def test_program_listing_mentions(name, expected):
+    """
+    Tests for :func:`~exhale.utils.programListingMentions`.
+    """
+    assert programListingMentions(name, listing, programListingTokens(listing)) is expected